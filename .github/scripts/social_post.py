@@ -8,13 +8,14 @@ Triggered by GitHub Actions when a commit message contains [post].
 
 import json
 import os
+import random
 import re
 import subprocess
 import sys
 import time
 
 import requests
-import tweepy
+from requests_oauthlib import OAuth1
 
 
 def parse_args() -> object:
@@ -46,6 +47,11 @@ TELEGRAM_BOT_TOKEN = os.environ.get("TELEGRAM_BOT_TOKEN", "")
 TELEGRAM_CHAT_ID = os.environ.get("TELEGRAM_CHAT_ID", "")
 TELEGRAM_TOPIC_ID = os.environ.get("TELEGRAM_TOPIC_ID", "")
 
+# One pooled session for every outbound call (GitHub, NEAR AI, Telegram) so
+# retries and follow-up requests reuse the established TCP/TLS connection.
+SESSION = requests.Session()
+SESSION.headers.update({"User-Agent": "onsocial-social-post/1"})
+
 
 def strip_control_tags(message: str) -> str:
     return re.sub(r"\[(?:post|no-post)\]", "", message, flags=re.IGNORECASE).strip()
@@ -138,7 +144,7 @@ def fetch_json(url: str, headers: dict[str, str] | None = None) -> object | None
         request_headers.update(headers)
 
     try:
-        response = requests.get(url, headers=request_headers, timeout=10)
+        response = SESSION.get(url, headers=request_headers, timeout=10)
         response.raise_for_status()
         return response.json()
     except requests.RequestException as exc:
@@ -384,7 +390,10 @@ PR_BODY_SUMMARY = summarize_pr_body(PR_BODY)
 # Generate posts via NEAR AI
 # =============================================================================
 
-PROMPT = f"""You are writing project update posts for OnSocial Protocol — a decentralized, \
+
+def build_prompt() -> str:
+    """Assemble the NEAR AI prompt. Only built once posting is actually needed."""
+    return f"""You are writing project update posts for OnSocial Protocol — a decentralized, \
 gasless social media platform built on NEAR Protocol.
 
 A new update was just pushed to the main branch.
@@ -481,16 +490,17 @@ No markdown formatting. NEVER include any URL or link.
 Return only the two posts with their labels, nothing else."""
 
 MAX_TWEET_LENGTH = 280
+MAX_RETRY_WAIT = 30
 
 
-def generate_posts() -> tuple[str, str]:
+def generate_posts(prompt: str) -> tuple[str, str]:
     """Call NEAR AI to generate tweet and telegram text with retry."""
     if not NEAR_AI_API_KEY:
         raise RuntimeError("NEAR_AI_API_KEY is not set. Cannot generate posts.")
     last_error: Exception | None = None
     for attempt in range(1, 4):
         try:
-            resp = requests.post(
+            resp = SESSION.post(
                 url="https://cloud-api.near.ai/v1/chat/completions",
                 headers={
                     "Authorization": f"Bearer {NEAR_AI_API_KEY}",
@@ -498,7 +508,7 @@ def generate_posts() -> tuple[str, str]:
                 },
                 json={
                     "model": "deepseek-ai/DeepSeek-V3.1",
-                    "messages": [{"role": "user", "content": PROMPT}],
+                    "messages": [{"role": "user", "content": prompt}],
                 },
                 timeout=45,
             )
@@ -506,29 +516,29 @@ def generate_posts() -> tuple[str, str]:
             output = resp.json()["choices"][0]["message"]["content"]
             print(f"NEAR AI output:\n{output}\n")
             return parse_posts(output)
+        except requests.HTTPError as exc:
+            status = exc.response.status_code if exc.response is not None else None
+            # Client errors other than rate limiting won't fix themselves
+            if status is not None and 400 <= status < 500 and status != 429:
+                raise RuntimeError(f"NEAR AI rejected the request: {exc}") from exc
+            last_error = exc
         except (requests.RequestException, KeyError) as exc:
             last_error = exc
-            wait = 2 ** attempt  # 2s, 4s, 8s
-            print(f"⚠️  NEAR AI attempt {attempt}/3 failed: {exc}. Retrying in {wait}s...")
+        if attempt < 3:
+            # ~2s, 4s, 8s with up to +50% jitter so parallel jobs don't retry in lockstep
+            wait = min(MAX_RETRY_WAIT, (2 ** attempt) * (1 + random.random() * 0.5))
+            print(f"⚠️  NEAR AI attempt {attempt}/3 failed: {last_error}. Retrying in {wait:.1f}s...")
             time.sleep(wait)
     raise RuntimeError(f"NEAR AI failed after 3 attempts: {last_error}")
 
 
 def parse_posts(output: str) -> tuple[str, str]:
     """Parse TWEET: and TELEGRAM: from AI output, handling multi-line values."""
-    tweet_text = ""
-    telegram_text = ""
-
-    # Use regex to capture everything after each label until the next label or end
-    tweet_match = re.search(
-        r"TWEET:\s*(.+?)(?=\nTELEGRAM:|\Z)", output, re.DOTALL
-    )
-    telegram_match = re.search(r"TELEGRAM:\s*(.+?)(?=\Z)", output, re.DOTALL)
-
-    if tweet_match:
-        tweet_text = tweet_match.group(1).strip()
-    if telegram_match:
-        telegram_text = telegram_match.group(1).strip()
+    # Everything after each label until the next label or end
+    _, tweet_label, rest = output.partition("TWEET:")
+    tweet_text = rest.partition("\nTELEGRAM:")[0].strip() if tweet_label else ""
+    _, telegram_label, rest = output.partition("TELEGRAM:")
+    telegram_text = rest.strip() if telegram_label else ""
 
     # Fallbacks
     if not tweet_text:
@@ -599,15 +609,18 @@ def post_to_x(text: str) -> bool:
         return False
 
     try:
-        client = tweepy.Client(
-            consumer_key=X_API_KEY,
-            consumer_secret=X_API_SECRET,
-            access_token=X_ACCESS_TOKEN,
-            access_token_secret=X_ACCESS_TOKEN_SECRET,
+        auth = OAuth1(X_API_KEY, X_API_SECRET, X_ACCESS_TOKEN, X_ACCESS_TOKEN_SECRET)
+        resp = SESSION.post(
+            "https://api.twitter.com/2/tweets",
+            json={"text": text},
+            auth=auth,
+            timeout=15,
         )
-        client.create_tweet(text=text)
-        print(f"✅ Posted to X ({len(text)} chars)")
-        return True
+        if resp.status_code == 201:
+            print(f"✅ Posted to X ({len(text)} chars)")
+            return True
+        print(f"❌ X error ({resp.status_code}): {resp.text}")
+        return False
     except Exception as e:
         print(f"❌ Failed to post to X: {e}")
         return False
@@ -632,7 +645,7 @@ def post_to_telegram(text: str) -> bool:
         }
         if TELEGRAM_TOPIC_ID:
             payload["message_thread_id"] = int(TELEGRAM_TOPIC_ID)
-        resp = requests.post(
+        resp = SESSION.post(
             f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage",
             json=payload,
             timeout=10,
@@ -676,7 +689,7 @@ def main() -> None:
     print(f"Detected change kind: {CHANGE_KIND}\n")
 
     try:
-        tweet_text, telegram_text = generate_posts()
+        tweet_text, telegram_text = generate_posts(build_prompt())
     except RuntimeError as err:
         print(f"Skipping social post: AI generation failed: {err}")
         sys.exit(0)
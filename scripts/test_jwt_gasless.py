@@ -20,11 +20,27 @@ import json
 import os
 import sys
 import time
-import urllib.request
-import urllib.error
 
-import base58
 import nacl.signing
+import requests
+
+try:
+    from based58 import b58decode
+except ImportError:
+    from base58 import b58decode
+
+try:
+    import orjson
+except ImportError:  # stdlib fallback
+    orjson = None
+
+
+def _dumps(obj) -> bytes:
+    return orjson.dumps(obj) if orjson else json.dumps(obj).encode()
+
+
+def _loads(data):
+    return orjson.loads(data) if orjson else json.loads(data)
 
 # ---------------------------------------------------------------------------
 # Config
@@ -37,11 +53,14 @@ CREDS_FILE = os.environ.get(
     os.path.expanduser(f"~/.near-credentials/testnet/{ACCOUNT_ID}.json"),
 )
 
+# One keep-alive session for the whole login → relay → RPC → GraphQL flow
+SESSION = requests.Session()
+
 
 def load_keypair(creds_file: str):
     with open(creds_file) as f:
         creds = json.load(f)
-    secret_bytes = base58.b58decode(creds["private_key"].split(":")[1])
+    secret_bytes = b58decode(creds["private_key"].split(":")[1].encode())
     signing_key = nacl.signing.SigningKey(secret_bytes[:32])
     public_key_str = creds["public_key"]
     return signing_key, public_key_str
@@ -50,28 +69,23 @@ def load_keypair(creds_file: str):
 def api(method: str, path: str, body=None, token=None):
     """Make an HTTP request to the gateway."""
     url = f"{GATEWAY_URL}{path}"
-    data = json.dumps(body).encode() if body else None
+    data = _dumps(body) if body else None
     headers = {"Content-Type": "application/json"}
     if token:
         headers["Authorization"] = f"Bearer {token}"
 
-    req = urllib.request.Request(url, data=data, headers=headers, method=method)
+    resp = SESSION.request(method, url, data=data, headers=headers, timeout=30)
     try:
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            result = json.loads(resp.read())
-            return resp.status, result
-    except urllib.error.HTTPError as e:
-        body_text = e.read().decode()
-        try:
-            return e.code, json.loads(body_text)
-        except json.JSONDecodeError:
-            return e.code, {"raw": body_text}
+        return resp.status_code, _loads(resp.content)
+    except ValueError:
+        if resp.ok:
+            raise
+        return resp.status_code, {"raw": resp.text}
 
 
 def rpc_read(account_id: str, contract_id: str, key: str):
     """Read a value from the core contract via NEAR RPC."""
-    args = json.dumps({"keys": [f"{account_id}/{key}"]})
-    args_b64 = base64.b64encode(args.encode()).decode()
+    args_b64 = base64.b64encode(_dumps({"keys": [f"{account_id}/{key}"]})).decode()
     rpc_body = {
         "jsonrpc": "2.0", "id": 1, "method": "query",
         "params": {
@@ -82,14 +96,15 @@ def rpc_read(account_id: str, contract_id: str, key: str):
             "args_base64": args_b64,
         },
     }
-    req = urllib.request.Request(
+    resp = SESSION.post(
         "https://rpc.testnet.near.org",
-        data=json.dumps(rpc_body).encode(),
+        data=_dumps(rpc_body),
         headers={"Content-Type": "application/json"},
+        timeout=15,
     )
-    with urllib.request.urlopen(req, timeout=15) as resp:
-        r = json.loads(resp.read())
-        return bytes(r["result"]["result"]).decode()
+    resp.raise_for_status()
+    r = _loads(resp.content)
+    return bytes(r["result"]["result"]).decode()
 
 
 # ---------------------------------------------------------------------------
@@ -183,32 +198,21 @@ def main():
     print(f"\n[5/5] Querying indexed events via Hasura...")
     time.sleep(2)
 
-    # First check indexer head block
-    head_query = {
-        "query": """{ dataUpdates(orderBy: {blockHeight: DESC}, limit: 1) { blockHeight } }""",
-    }
-    status_h, head_result = api("POST", "/graph/query", head_query, token=token)
-    indexer_head = None
-    if status_h == 200 and "data" in head_result:
-        heads = head_result["data"].get("dataUpdates", [])
-        if heads:
-            indexer_head = int(heads[0]["blockHeight"])
-            print(f"      Indexer head block: {indexer_head:,}")
-
+    # Indexer head block + this account's recent updates in one round trip
     graphql_query = {
         "query": """query RecentUpdates($accountId: String!, $limit: Int!) {
-  dataUpdates(
+  head: dataUpdates(orderBy: { blockHeight: DESC }, limit: 1) {
+    blockHeight
+  }
+  recent: dataUpdates(
     where: { accountId: { _eq: $accountId } }
     orderBy: { blockTimestamp: DESC }
     limit: $limit
   ) {
-    id
     operation
-    dataType
     path
     value
     blockHeight
-    blockTimestamp
     author
     receiptId
   }
@@ -221,8 +225,15 @@ def main():
 
     status, gql_result = api("POST", "/graph/query", graphql_query, token=token)
 
+    indexer_head = None
+    if status == 200 and "data" in gql_result:
+        heads = gql_result["data"].get("head", [])
+        if heads:
+            indexer_head = int(heads[0]["blockHeight"])
+            print(f"      Indexer head block: {indexer_head:,}")
+
     if status == 200 and "data" in gql_result:
-        events = gql_result["data"].get("dataUpdates", [])
+        events = gql_result["data"].get("recent", [])
         if events:
             print(f"      ✅ Found {len(events)} indexed event(s):")
             for i, ev in enumerate(events):
@@ -1,16 +1,51 @@
 """Shared helpers for test-core: auth, relay, RPC, views, CLI."""
 
 import base64
+import functools
+import itertools
 import json
 import os
+import random
+import re
 import subprocess
 import sys
+import threading
 import time
-import urllib.request
-import urllib.error
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from decimal import Decimal
 
-import base58
 import nacl.signing
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from based58 import b58decode  # Rust-backed; base58 is pure Python
+except ImportError:
+    from base58 import b58decode
+
+import nep366
+
+try:
+    import orjson
+except ImportError:  # stdlib fallback
+    orjson = None
+
+
+def _dumps(obj) -> bytes:
+    return orjson.dumps(obj) if orjson else json.dumps(obj).encode()
+
+
+def _loads(data):
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def _dumps_canonical(obj) -> bytes:
+    """Compact JSON with sorted keys, for use as a stable cache key."""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(obj, sort_keys=True, separators=(",", ":")).encode()
 
 # ---------------------------------------------------------------------------
 # Config
@@ -25,6 +60,9 @@ CREDS_FILE = os.environ.get(
 RPC_URL = os.environ.get("RPC_URL", "https://test.rpc.fastnear.com")
 RPC_FALLBACK = os.environ.get("RPC_FALLBACK", "https://archival-rpc.testnet.near.org")
 RPC_URLS = [RPC_URL, RPC_FALLBACK]
+# near_call / near_batch_call shell out to `near call` by default; set
+# NEAR_CALL_IN_PROCESS=1 to sign in-process with the cached nonce instead
+NEAR_CALL_IN_PROCESS = os.environ.get("NEAR_CALL_IN_PROCESS", "") not in ("", "0")
 
 # State
 _jwt_token: str | None = None
@@ -32,54 +70,79 @@ _jwt_token: str | None = None
 # Multi-account session cache: account_id -> jwt_token
 _sessions: dict = {}
 
+# On-disk JWT cache shared across runs: "<gateway>|<account_id>" -> token
+JWT_CACHE_FILE = os.environ.get(
+    "JWT_CACHE_FILE", os.path.expanduser("~/.cache/onsocial/jwt.json"),
+)
+JWT_MIN_TTL = 30  # seconds of validity left before a cached JWT is reused
+
+# Pooled HTTP session shared by gateway + RPC calls (keep-alive, TLS reuse)
+# Status retries only apply to idempotent methods; relay POSTs are never
+# replayed behind the caller's back.
+_SESSION = requests.Session()
+_SESSION.headers["Connection"] = "keep-alive"
+_ADAPTER = HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=3, backoff_factor=0.3,
+        status_forcelist=[502, 503, 504], raise_on_status=False,
+    ),
+)
+# http:// too, so a local gateway/sandbox RPC gets the same pool and retries
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.mount("http://", _ADAPTER)
+
 
 # ---------------------------------------------------------------------------
 # Keypair
 # ---------------------------------------------------------------------------
-def load_keypair():
-    with open(CREDS_FILE) as f:
+@functools.lru_cache(maxsize=64)
+def _load_keypair_cached(creds_file: str, mtime_ns: int):
+    with open(creds_file) as f:
         creds = json.load(f)
-    secret_bytes = base58.b58decode(creds["private_key"].split(":")[1])
+    secret_bytes = b58decode(creds["private_key"].split(":")[1].encode())
     signing_key = nacl.signing.SigningKey(secret_bytes[:32])
-    public_key_str = creds["public_key"]
-    return signing_key, public_key_str
+    return signing_key, creds["public_key"]
+
+
+def load_keypair():
+    return load_keypair_from(CREDS_FILE)
 
 
 def load_keypair_from(creds_file: str):
-    """Load keypair from a specific credentials file."""
-    with open(creds_file) as f:
-        creds = json.load(f)
-    secret_bytes = base58.b58decode(creds["private_key"].split(":")[1])
-    signing_key = nacl.signing.SigningKey(secret_bytes[:32])
-    return signing_key, creds["public_key"]
+    """Load keypair from a specific credentials file.
+
+    Cached per (path, mtime) so a rewritten credentials file is picked up.
+    """
+    return _load_keypair_cached(creds_file, os.stat(creds_file).st_mtime_ns)
 
 
 # ---------------------------------------------------------------------------
 # HTTP helpers
 # ---------------------------------------------------------------------------
 def _http(method: str, url: str, body=None, headers=None):
-    data = json.dumps(body).encode() if body else None
+    if isinstance(body, bytes):
+        data = body
+    else:
+        data = _dumps(body) if body else None
     hdrs = {"Content-Type": "application/json"}
     if headers:
         hdrs.update(headers)
-    last_err = None
     for attempt in range(3):
-        req = urllib.request.Request(url, data=data, headers=hdrs, method=method)
         try:
-            with urllib.request.urlopen(req, timeout=30) as resp:
-                return resp.status, json.loads(resp.read())
-        except urllib.error.HTTPError as e:
-            raw = e.read().decode()
-            try:
-                return e.code, json.loads(raw)
-            except json.JSONDecodeError:
-                return e.code, {"raw": raw}
-        except urllib.error.URLError as e:
-            last_err = e
+            resp = _SESSION.request(method, url, data=data, headers=hdrs, timeout=30)
+        except (requests.ConnectionError, requests.Timeout):
             if attempt < 2:
                 time.sleep(3 * (attempt + 1))
                 continue
             raise
+        try:
+            return resp.status_code, _loads(resp.content)
+        except ValueError:
+            if resp.ok:
+                raise
+            return resp.status_code, {"raw": resp.text}
 
 
 def api(method: str, path: str, body=None, token=None):
@@ -89,18 +152,107 @@ def api(method: str, path: str, body=None, token=None):
     return _http(method, f"{GATEWAY_URL}{path}", body, headers)
 
 
+# ---------------------------------------------------------------------------
+# Auth — on-disk JWT cache
+# ---------------------------------------------------------------------------
+_jwt_cache_lock = threading.Lock()  # Serialises read-modify-write of the file
+
+
+def _jwt_cache_key(account_id: str) -> str:
+    return f"{GATEWAY_URL}|{account_id}"
+
+
+def _read_jwt_cache() -> dict:
+    try:
+        with open(JWT_CACHE_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_jwt_cache(cache: dict):
+    os.makedirs(os.path.dirname(JWT_CACHE_FILE), exist_ok=True)
+    fd = os.open(JWT_CACHE_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as f:
+        json.dump(cache, f)
+
+
+def _jwt_exp(token: str) -> int:
+    """Read the `exp` claim from a JWT without verifying it (0 if absent)."""
+    try:
+        payload = token.split(".")[1]
+        claims = _loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return int(claims.get("exp", 0))
+    except (IndexError, ValueError, TypeError):
+        return 0
+
+
+def _jwt_fresh(token: str | None) -> bool:
+    """True if `token` has more than JWT_MIN_TTL left.
+
+    A token without an exp is reused until the gateway rejects it (a 401
+    evicts it via _evict_jwt). Applies to memory and disk alike.
+    """
+    if not token:
+        return False
+    exp = _jwt_exp(token)
+    return not exp or exp - time.time() > JWT_MIN_TTL
+
+
+def _cached_jwt(account_id: str) -> str | None:
+    token = _read_jwt_cache().get(_jwt_cache_key(account_id))
+    return token if _jwt_fresh(token) else None
+
+
+def _store_jwt(account_id: str, token: str):
+    with _jwt_cache_lock:
+        cache = _read_jwt_cache()
+        cache[_jwt_cache_key(account_id)] = token
+        try:
+            _write_jwt_cache(cache)
+        except OSError:
+            pass  # Cache is best-effort
+
+
+def _evict_jwt(account_id: str):
+    """Forget a rejected JWT in memory and on disk."""
+    global _jwt_token
+    _sessions.pop(account_id, None)
+    if account_id == ACCOUNT_ID:
+        _jwt_token = None
+    with _jwt_cache_lock:
+        cache = _read_jwt_cache()
+        if cache.pop(_jwt_cache_key(account_id), None) is not None:
+            try:
+                _write_jwt_cache(cache)
+            except OSError:
+                pass
+
+
 # ---------------------------------------------------------------------------
 # Auth — JWT login (default account)
 # ---------------------------------------------------------------------------
+def _auth_message() -> str:
+    """'OnSocial Auth: <ISO-8601 UTC>' — formatted directly, no strftime."""
+    t = time.gmtime()
+    return (
+        f"OnSocial Auth: {t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+        f"T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}.000Z"
+    )
+
+
 def login() -> str:
-    """Login default ACCOUNT_ID and return JWT token. Caches across calls."""
+    """Login default ACCOUNT_ID and return JWT token. Caches across calls and runs."""
     global _jwt_token
-    if _jwt_token:
+    if _jwt_fresh(_jwt_token):
+        return _jwt_token
+    cached = _cached_jwt(ACCOUNT_ID)
+    if cached:
+        _jwt_token = cached
         return _jwt_token
 
     signing_key, public_key = load_keypair()
-    timestamp = time.strftime("%Y-%m-%dT%H:%M:%S.000Z", time.gmtime())
-    message = f"OnSocial Auth: {timestamp}"
+    message = _auth_message()
     signed = signing_key.sign(message.encode())
     sig_b64 = base64.b64encode(signed.signature).decode()
 
@@ -115,6 +267,7 @@ def login() -> str:
         sys.exit(1)
 
     _jwt_token = result["token"]
+    _store_jwt(ACCOUNT_ID, _jwt_token)
     return _jwt_token
 
 
@@ -122,16 +275,20 @@ def login() -> str:
 # Auth — Multi-account login
 # ---------------------------------------------------------------------------
 def login_as(account_id: str, creds_file: str | None = None) -> str:
-    """Login as a specific account. Caches JWT across calls."""
-    if account_id in _sessions:
-        return _sessions[account_id]
+    """Login as a specific account. Caches JWT across calls and runs."""
+    token = _sessions.get(account_id)
+    if _jwt_fresh(token):
+        return token
+    cached = _cached_jwt(account_id)
+    if cached:
+        _sessions[account_id] = cached
+        return cached
     if creds_file is None:
         creds_file = os.path.expanduser(
             f"~/.near-credentials/testnet/{account_id}.json"
         )
     signing_key, public_key = load_keypair_from(creds_file)
-    timestamp = time.strftime("%Y-%m-%dT%H:%M:%S.000Z", time.gmtime())
-    message = f"OnSocial Auth: {timestamp}"
+    message = _auth_message()
     signed = signing_key.sign(message.encode())
     sig_b64 = base64.b64encode(signed.signature).decode()
 
@@ -146,9 +303,21 @@ def login_as(account_id: str, creds_file: str | None = None) -> str:
             f"Login failed for {account_id} ({status}): {json.dumps(result)}"
         )
     _sessions[account_id] = result["token"]
+    _store_jwt(account_id, result["token"])
     return _sessions[account_id]
 
 
+def login_many(account_ids: list[str]) -> dict[str, str]:
+    """Login several accounts concurrently. Returns account_id -> JWT.
+
+    Each login is an independent /auth/login round trip, so they overlap on
+    the pooled session instead of running back to back.
+    """
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        tokens = list(pool.map(login_as, account_ids))
+    return dict(zip(account_ids, tokens))
+
+
 # ---------------------------------------------------------------------------
 # Relay — Gasless execute (default account)
 # ---------------------------------------------------------------------------
@@ -167,6 +336,11 @@ def relay_execute(
         body["target_account"] = target_account
 
     status, result = api("POST", "/relay/execute", body, token=token)
+    if status == 401:
+        # Cached JWT was revoked or expired early — log in again once
+        _evict_jwt(ACCOUNT_ID)
+        status, result = api("POST", "/relay/execute", body, token=login())
+    _invalidate_views(action)
     if status not in (200, 202):
         raise RuntimeError(f"Relay failed ({status}): {json.dumps(result)}")
     return result
@@ -185,13 +359,71 @@ def relay_execute_as(
 
     Set target_account for cross-account writes (actor != target).
     """
-    token = login_as(account_id)
+    try:
+        return _relay_bytes(
+            account_id, encode_relay_body(action, options, target_account),
+        )
+    finally:
+        _invalidate_views(action)
+
+
+def encode_relay_body(
+    action: dict,
+    options: dict | None = None,
+    target_account: str | None = None,
+) -> bytes:
+    """Serialize a /relay/execute body once, for reuse with relay_execute_bytes."""
     body: dict = {"action": action}
     if options:
         body["options"] = options
     if target_account:
         body["target_account"] = target_account
+    return _dumps(body)
+
+
+def relay_execute_bytes(account_id: str, body: bytes) -> dict:
+    """Relay a pre-serialized body as a specific account.
+
+    Loops that send the same body for several accounts can encode it once
+    with encode_relay_body instead of re-serializing per call.
+    """
+    try:
+        return _relay_bytes(account_id, body)
+    finally:
+        _invalidate_views()
+
+
+def relay_pipeline(stages: list[list[tuple[str | None, dict]]]) -> list[list]:
+    """Run dependent relay writes stage by stage.
+
+    Each stage is a list of (account_id, action) pairs that only depend on
+    earlier stages (account_id None = default account). A stage's actions are
+    submitted concurrently and the pipeline waits for exactly those txs
+    (polled together, see wait_for_txs) before starting the next stage.
+    Returns each tx's result, per stage. Raises on the first relay or tx
+    failure.
+    """
+    def submit(step):
+        account_id, action = step
+        if account_id is None:
+            return relay_execute(action)
+        return relay_execute_as(account_id, action)
+
+    results = []
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        for stage in stages:
+            results.append(wait_for_txs(list(pool.map(submit, stage))))
+    return results
+
+
+def _relay_bytes(account_id: str, body: bytes) -> dict:
+    token = login_as(account_id)
     status, result = api("POST", "/relay/execute", body, token=token)
+    if status == 401:
+        _evict_jwt(account_id)
+        status, result = api(
+            "POST", "/relay/execute", body, token=login_as(account_id),
+        )
     if status not in (200, 202):
         raise RuntimeError(
             f"Relay failed for {account_id} ({status}): {json.dumps(result)}"
@@ -202,6 +434,11 @@ def relay_execute_as(
 # ---------------------------------------------------------------------------
 # CLI — Direct NEAR call for deposit-requiring operations
 # ---------------------------------------------------------------------------
+# Each CLI process reads the access-key nonce itself, so concurrent calls
+# from one account would race; parallel tests serialise per signer.
+_near_cli_locks: dict[str, threading.Lock] = {}
+
+
 def near_call(
     account_id: str,
     action: dict,
@@ -215,8 +452,16 @@ def near_call(
     (e.g., create_proposal needs 0.1 NEAR) since the relay uses
     FunctionCall keys which cannot attach deposits.
 
+    With NEAR_CALL_IN_PROCESS the tx is signed in-process instead
+    (near_call_direct: cached nonce, no CLI launch) and the JSON-encoded
+    return value is returned in place of the CLI output.
+
     Set target_account for cross-account writes (actor != target).
     """
+    if NEAR_CALL_IN_PROCESS:
+        return json.dumps(_near_call_in_process(
+            account_id, action, deposit, gas, target_account,
+        ))
     request_data: dict = {"action": action}
     if target_account:
         request_data["target_account"] = target_account
@@ -230,13 +475,17 @@ def near_call(
         "--networkId", "testnet",
     ]
     env = {**os.environ, "NEAR_TESTNET_RPC": RPC_URL}
+    lock = _near_cli_locks.setdefault(account_id, threading.Lock())
     last_err = None
     for attempt in range(2):
-        result = subprocess.run(
-            cmd, capture_output=True, text=True, timeout=90, env=env,
-        )
+        with lock:
+            result = subprocess.run(
+                cmd, capture_output=True, text=True, timeout=90, env=env,
+            )
         output = result.stdout + result.stderr
+        _invalidate_views(action)
         if result.returncode == 0:
+            _record_cli_proposal_outcomes(output)
             return output
         # Don't retry contract panics or balance issues
         if "panicked" in output or "NotEnoughBalance" in output:
@@ -253,7 +502,12 @@ def near_call_result(
     deposit: str = "0",
     gas: str = "300000000000000",
 ) -> str | None:
-    """Call core contract via CLI and extract the return value (last line)."""
+    """Call core contract and extract the return value as a string."""
+    if NEAR_CALL_IN_PROCESS:
+        value = _near_call_in_process(account_id, action, deposit, gas)
+        if value is None or value == "":
+            return None
+        return value if isinstance(value, str) else json.dumps(value)
     output = near_call(account_id, action, deposit, gas)
     # The CLI prints the return value as the last non-empty line
     lines = [l.strip() for l in output.strip().split("\n") if l.strip()]
@@ -268,85 +522,433 @@ def near_call_result(
     return last if last else None
 
 
+def _near_call_in_process(account_id, action, deposit, gas, target_account=None):
+    """near_call_direct with near_call's error contract (RuntimeError only)."""
+    try:
+        return near_call_direct(account_id, action, deposit, gas, target_account)
+    except (requests.RequestException, TimeoutError, OSError, KeyError) as e:
+        raise RuntimeError(f"near call failed: {e}") from e
+
+
+# ---------------------------------------------------------------------------
+# Direct — in-process signed transaction (no near CLI)
+# ---------------------------------------------------------------------------
+def _near_to_yocto(amount: str) -> int:
+    return int(Decimal(amount) * 10**24)
+
+
+# (account_id, public_key) -> [last used nonce, block hash, fetched at]
+_access_keys: dict = {}
+_access_keys_lock = threading.Lock()
+BLOCK_HASH_TTL = 60  # seconds; well inside NEAR's block-hash validity window
+
+
+def _next_nonce(account_id: str, public_key: str) -> tuple[int, str]:
+    """Return (nonce, block_hash) for the next tx from this access key.
+
+    Only queries view_access_key on first use or when the cached block hash
+    is older than BLOCK_HASH_TTL; otherwise increments the local nonce.
+    """
+    key = (account_id, public_key)
+    with _access_keys_lock:
+        entry = _access_keys.get(key)
+        if entry and time.time() - entry[2] < BLOCK_HASH_TTL:
+            entry[0] += 1
+            return entry[0], entry[1]
+        r = _rpc_post({
+            "jsonrpc": "2.0", "id": 1, "method": "query",
+            "params": {
+                "request_type": "view_access_key",
+                "finality": "final",
+                "account_id": account_id,
+                "public_key": public_key,
+            },
+        })
+        if "error" in r or "error" in r.get("result", {}):
+            raise RuntimeError(
+                f"view_access_key failed: {r.get('error') or r['result']['error']}"
+            )
+        nonce = r["result"]["nonce"] + 1
+        if entry:
+            nonce = max(nonce, entry[0] + 1)
+        _access_keys[key] = [nonce, r["result"]["block_hash"], time.time()]
+        return nonce, r["result"]["block_hash"]
+
+
+def _invalidate_nonce(account_id: str, public_key: str):
+    with _access_keys_lock:
+        _access_keys.pop((account_id, public_key), None)
+
+
+def near_call_direct(
+    account_id: str,
+    action: dict,
+    deposit: str = "0",
+    gas: str = "300000000000000",
+    target_account: str | None = None,
+    creds_file: str | None = None,
+):
+    """Sign and broadcast an `execute` call in-process. Returns the result.
+
+    Same arguments as near_call (deposit in NEAR), but skips the Node.js
+    CLI launch. Nonces are tracked locally, so repeat calls from the same
+    key cost a single broadcast_tx_commit.
+    Raises RuntimeError if the transaction fails.
+    """
+    request_data: dict = {"action": action}
+    if target_account:
+        request_data["target_account"] = target_account
+    fn_call = nep366.encode_function_call(
+        "execute",
+        _dumps({"request": request_data}),
+        int(gas),
+        _near_to_yocto(deposit),
+    )
+    return _send_direct(account_id, [fn_call], [action], creds_file)
+
+
+def near_batch_call(
+    account_id: str,
+    actions: list[dict],
+    deposit_per_action: str = "0",
+    gas: str = "300000000000000",
+    creds_file: str | None = None,
+):
+    """Run several `execute` actions as one signed transaction.
+
+    The FunctionCall actions execute in order within a single receipt, so
+    later actions see earlier ones' state and a failure reverts them all.
+    `gas` is the transaction total and is split evenly. Returns the result
+    of the LAST action (e.g. the proposal id from a trailing create_proposal).
+
+    Without NEAR_CALL_IN_PROCESS the CLI can't batch, so the actions go out
+    as consecutive near_calls (same order, but not atomic), each with the
+    full `gas`.
+    """
+    if not actions:
+        raise ValueError("near_batch_call needs at least one action")
+    if not NEAR_CALL_IN_PROCESS:
+        for action in actions[:-1]:
+            near_call(account_id, action, deposit_per_action, gas)
+        return near_call_result(account_id, actions[-1], deposit_per_action, gas)
+    per_action_gas = int(gas) // len(actions)
+    fn_calls = [
+        nep366.encode_function_call(
+            "execute",
+            _dumps({"request": {"action": action}}),
+            per_action_gas,
+            _near_to_yocto(deposit_per_action),
+        )
+        for action in actions
+    ]
+    return _send_direct(account_id, fn_calls, actions, creds_file)
+
+
+def _send_direct(
+    account_id: str,
+    fn_calls: list[bytes],
+    actions: list[dict],
+    creds_file: str | None,
+):
+    if creds_file is None:
+        creds_file = os.path.expanduser(
+            f"~/.near-credentials/testnet/{account_id}.json"
+        )
+    signing_key, public_key = load_keypair_from(creds_file)
+    # Shares near_call's per-signer lock: the CLI doesn't see our nonce cache
+    lock = _near_cli_locks.setdefault(account_id, threading.Lock())
+
+    for attempt in range(2):
+        with lock:  # Nonces must also reach the chain in the order issued
+            nonce, block_hash = _next_nonce(account_id, public_key)
+            signed_tx = nep366.build_signed_transaction(
+                signer_id=account_id,
+                receiver_id=CONTRACT_ID,
+                actions=fn_calls,
+                nonce=nonce,
+                block_hash_b58=block_hash,
+                signing_key=signing_key,
+                public_key_str=public_key,
+            )
+            r = _rpc_post({
+                "jsonrpc": "2.0", "id": 1,
+                "method": "broadcast_tx_commit",
+                "params": [signed_tx],
+            }, timeouts=(TX_WAIT_TIMEOUT, TX_WAIT_TIMEOUT))
+        for action in actions:
+            _invalidate_views(action)
+        if "error" not in r:
+            break
+        err = json.dumps(r["error"])
+        # Stale cached nonce/block hash (e.g. key used elsewhere) — refetch once
+        if attempt == 0 and ("InvalidNonce" in err or "Expired" in err):
+            _invalidate_nonce(account_id, public_key)
+            continue
+        raise RuntimeError(f"broadcast failed: {err[-500:]}")
+
+    st = r["result"]["status"]
+    if isinstance(st, dict) and "Failure" in st:
+        raise RuntimeError(f"TX failed: {json.dumps(st['Failure'])}")
+    _record_proposal_outcomes(r["result"])
+    return _decode_success_value(st.get("SuccessValue", ""))
+
+
+_EVENT_JSON_PREFIX = "EVENT_JSON:"
+
+
+def _record_proposal_outcomes(result: dict):
+    """Note proposal statuses from a tx's proposal_status_updated events.
+
+    broadcast_tx_commit returns the receipt logs inline, so a vote (or an
+    auto_vote create) that settles a proposal tells us so without a view.
+    """
+    for ro in result.get("receipts_outcome", ()):
+        for log in ro.get("outcome", {}).get("logs", ()):
+            if log.startswith(_EVENT_JSON_PREFIX):
+                _record_event_log(log)
+
+
+def _record_cli_proposal_outcomes(output: str):
+    """Same as _record_proposal_outcomes, from the receipt logs that
+    `near call` prints (one `Log [contract]: EVENT_JSON:...` line each)."""
+    for line in output.splitlines():
+        i = line.find(_EVENT_JSON_PREFIX)
+        if i >= 0:
+            _record_event_log(line[i:].strip())
+
+
+def _record_event_log(log: str):
+    try:
+        event = _loads(log[len(_EVENT_JSON_PREFIX):])
+    except ValueError:
+        return
+    if not isinstance(event, dict):
+        return
+    for d in event.get("data", ()):
+        if d.get("operation") == "proposal_status_updated":
+            key = (d.get("group_id", ""), str(d.get("proposal_id", "")))
+            _proposal_outcomes[key] = str(d.get("status", "")).lower()
+
+
 # ---------------------------------------------------------------------------
 # RPC — low-level POST with primary→fallback failover
 # ---------------------------------------------------------------------------
-def _rpc_post(body: dict) -> dict:
+def _rpc_post(
+    body: dict | list, timeouts: tuple[float, float] = (10, 20),
+) -> dict | list:
     """POST to NEAR RPC, trying primary (10s) then fallback (20s)."""
-    data = json.dumps(body).encode()
+    data = _dumps(body)
     headers = {"Content-Type": "application/json"}
-    timeouts = [10, 20]
     last_err = None
     for url, t in zip(RPC_URLS, timeouts):
-        req = urllib.request.Request(url, data=data, headers=headers)
         try:
-            with urllib.request.urlopen(req, timeout=t) as resp:
-                r = json.loads(resp.read())
-                # 429 from primary → try fallback
-                return r
-        except urllib.error.HTTPError as e:
-            if e.code == 429:
-                last_err = e
-                continue
-            raise
-        except (urllib.error.URLError, TimeoutError, OSError) as e:
+            resp = _SESSION.post(url, data=data, headers=headers, timeout=t)
+        except (requests.RequestException, TimeoutError, OSError) as e:
             last_err = e
             continue
+        # 429 from primary → try fallback
+        if resp.status_code == 429:
+            last_err = requests.HTTPError(f"429 from {url}", response=resp)
+            continue
+        resp.raise_for_status()
+        return _loads(resp.content)
     raise last_err or RuntimeError("All RPC endpoints failed")
 
 
+RPC_BATCH_SIZE = 10
+
+
+def rpc_batch(bodies: list[dict]) -> list[dict]:
+    """POST JSON-RPC requests as batch arrays of up to RPC_BATCH_SIZE.
+
+    Responses are matched back by id and returned in request order. If an
+    endpoint rejects batching, that chunk is sent one request at a time.
+    """
+    results: list[dict] = []
+    for start in range(0, len(bodies), RPC_BATCH_SIZE):
+        chunk = [
+            {**body, "id": i}
+            for i, body in enumerate(bodies[start:start + RPC_BATCH_SIZE])
+        ]
+        try:
+            r = _rpc_post(chunk)
+        except requests.HTTPError:
+            r = None
+        if not isinstance(r, list):
+            results.extend(_rpc_post(body) for body in chunk)
+            continue
+        by_id = {item.get("id"): item for item in r if isinstance(item, dict)}
+        results.extend(
+            by_id.get(i, {"error": f"no response for batch id {i}"})
+            for i in range(len(chunk))
+        )
+    return results
+
+
 # ---------------------------------------------------------------------------
 # TX result — poll NEAR RPC for finalized return value
 # ---------------------------------------------------------------------------
+TX_POLL_MIN_DELAY = 0.2
+TX_POLL_MAX_DELAY = 1.0
+TX_WAIT_UNTIL = "EXECUTED_OPTIMISTIC"  # all receipts done; views may trail by a block
+TX_WAIT_TIMEOUT = 15  # seconds; the node ends its own wait at ~10s
+
+
+def _decode_success_value(val: str):
+    if not val:
+        return None
+    decoded = base64.b64decode(val).decode()
+    try:
+        return _loads(decoded)
+    except ValueError:
+        return decoded
+
+
 def get_tx_result(
     tx_hash: str,
     sender_id: str = "relayer.onsocial.testnet",
     timeout: int = 90,
 ):
-    """Poll NEAR RPC until tx finalizes. Returns the function-call result."""
+    """Wait for a tx to execute via NEAR RPC. Returns the function-call result.
+
+    Uses the `tx` method's server-side wait (wait_until), so the node
+    answers as soon as the outcome exists instead of us sleeping between
+    polls. If the node doesn't know the tx yet, times out its wait, or
+    doesn't support wait_until, falls back to polling that starts at 200ms
+    and backs off (with jitter) to TX_POLL_MAX_DELAY.
+    """
     deadline = time.time() + timeout
+    delay = TX_POLL_MIN_DELAY
+    params: dict | list = {
+        "tx_hash": tx_hash,
+        "sender_account_id": sender_id,
+        "wait_until": TX_WAIT_UNTIL,
+    }
     while time.time() < deadline:
         try:
             r = _rpc_post({
                 "jsonrpc": "2.0", "id": 1,
                 "method": "tx",
-                "params": [tx_hash, sender_id],
-            })
-            if "error" in r:
-                time.sleep(2)
+                "params": params,
+            }, timeouts=(TX_WAIT_TIMEOUT, TX_WAIT_TIMEOUT))
+            if r.get("error", {}).get("name") == "REQUEST_VALIDATION_ERROR":
+                if isinstance(params, list):
+                    # Legacy form rejected too: bad hash/sender, not an old node
+                    raise RuntimeError(f"tx query rejected: {json.dumps(r['error'])}")
+                params = [tx_hash, sender_id]  # Node predates wait_until
                 continue
-            st = r["result"]["status"]
-            if isinstance(st, dict):
-                if "SuccessValue" in st:
-                    val = st["SuccessValue"]
-                    if val:
-                        decoded = base64.b64decode(val).decode()
-                        try:
-                            return json.loads(decoded)
-                        except json.JSONDecodeError:
-                            return decoded
-                    return None
-                if "Failure" in st:
-                    raise RuntimeError(
-                        f"TX failed: {json.dumps(st['Failure'])}"
-                    )
-        except (urllib.error.URLError, urllib.error.HTTPError, TimeoutError, OSError):
-            time.sleep(4)
-            continue
-        time.sleep(3)
+            if "error" not in r:
+                st = r["result"]["status"]
+                if isinstance(st, dict):
+                    _invalidate_views()
+                    if "SuccessValue" in st:
+                        return _decode_success_value(st["SuccessValue"])
+                    if "Failure" in st:
+                        raise RuntimeError(
+                            f"TX failed: {json.dumps(st['Failure'])}"
+                        )
+        except (requests.RequestException, TimeoutError, OSError):
+            # Transport trouble: don't hammer the endpoint at the fast rate
+            delay = max(delay, 1.0)
+        time.sleep(delay)
+        delay = min(delay * 1.7 + random.uniform(0, 0.1), TX_POLL_MAX_DELAY)
     raise TimeoutError(f"TX {tx_hash} not finalized in {timeout}s")
 
 
+class TxTracker:
+    """Multiplex outcome polling for many in-flight txs.
+
+    track() returns a Future; one background thread polls every pending
+    hash in a single rpc_batch per interval and resolves each future when
+    its tx reaches a terminal status. The thread exits when nothing is
+    pending and restarts on the next track().
+    """
+
+    def __init__(self, interval: float = 0.5):
+        self.interval = interval
+        self._pending: dict[str, tuple[str, float, Future]] = {}
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def track(
+        self,
+        tx_hash: str,
+        sender_id: str = "relayer.onsocial.testnet",
+        timeout: float = 90,
+    ) -> Future:
+        with self._lock:
+            if tx_hash in self._pending:
+                return self._pending[tx_hash][2]
+            fut: Future = Future()
+            self._pending[tx_hash] = (sender_id, time.time() + timeout, fut)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+        return fut
+
+    def _run(self):
+        try:
+            self._poll()
+        except Exception as e:
+            # Fail everything still waiting rather than leave it to hang
+            with self._lock:
+                failed = list(self._pending.values())
+                self._pending.clear()
+                self._thread = None
+            for _, _, fut in failed:
+                if not fut.done():
+                    fut.set_exception(e)
+        finally:
+            with self._lock:  # let the next track() start a fresh poller
+                if self._thread is threading.current_thread():
+                    self._thread = None
+
+    def _poll(self):
+        while True:
+            with self._lock:
+                if not self._pending:
+                    self._thread = None
+                    return
+                batch = list(self._pending.items())
+            try:
+                responses = rpc_batch([
+                    {"jsonrpc": "2.0", "method": "tx", "params": [h, sender]}
+                    for h, (sender, _, _) in batch
+                ])
+            except (requests.RequestException, TimeoutError, OSError):
+                responses = [{"error": "transport"}] * len(batch)
+            now = time.time()
+            for (h, (_, expires, fut)), r in zip(batch, responses):
+                st = r.get("result", {}).get("status") if "error" not in r else None
+                if isinstance(st, dict) and "SuccessValue" in st:
+                    self._resolve(h, fut, result=_decode_success_value(st["SuccessValue"]))
+                elif isinstance(st, dict) and "Failure" in st:
+                    self._resolve(h, fut, error=RuntimeError(
+                        f"TX failed: {json.dumps(st['Failure'])}"
+                    ))
+                elif now >= expires:
+                    self._resolve(h, fut, error=TimeoutError(f"TX {h} not finalized"))
+            time.sleep(self.interval)
+
+    def _resolve(self, tx_hash: str, fut: Future, result=None, error=None):
+        with self._lock:
+            self._pending.pop(tx_hash, None)
+        _invalidate_views()
+        if error is not None:
+            fut.set_exception(error)
+        else:
+            fut.set_result(result)
+
+
+TX_TRACKER = TxTracker()
+
+
 # ---------------------------------------------------------------------------
 # RPC — Direct contract view calls
 # ---------------------------------------------------------------------------
-def view_call(method_name: str, args: dict, _retries: int = 3):
-    """Call a view method on the contract via NEAR RPC.
-
-    Uses primary→fallback failover per attempt, with retries on transient errors.
-    """
-    args_b64 = base64.b64encode(json.dumps(args).encode()).decode()
-    rpc_body = {
+def _view_body(method_name: str, args: dict) -> dict:
+    args_b64 = base64.b64encode(_dumps(args)).decode()
+    return {
         "jsonrpc": "2.0", "id": 1, "method": "query",
         "params": {
             "request_type": "call_function",
@@ -356,14 +958,81 @@ def view_call(method_name: str, args: dict, _retries: int = 3):
             "args_base64": args_b64,
         },
     }
+
+
+def _decode_view(r: dict):
+    if "error" in r:
+        raise RuntimeError(f"RPC error: {r['error']}")
+    return _loads(bytes(r["result"]["result"]))
+
+
+# Views whose answer only changes when a write lands. Results are memoised
+# until the next write / tx completion / chain wait (see _invalidate_views).
+CACHED_VIEWS = frozenset({
+    "get_group_config", "is_group_member", "is_group_owner", "has_permission",
+    "get_storage_balance", "is_blacklisted",
+})
+_view_cache: dict[tuple[str, str], object] = {}
+_view_cache_lock = threading.Lock()
+# Bumped by every invalidation; a read only caches its answer if no
+# invalidation ran while its RPC was in flight (it may predate the write)
+_view_cache_gen = 0
+
+
+def _invalidate_views(action: dict | None = None):
+    """Drop cached views touched by `action` (all of them if unknown)."""
+    global _view_cache_gen
+    gid = action.get("group_id") if action else None
+    with _view_cache_lock:
+        _view_cache_gen += 1
+        if gid is None:
+            _view_cache.clear()
+            return
+        # Substring match also catches group paths in has_permission args
+        for key in [k for k in _view_cache if gid in k[1]]:
+            del _view_cache[key]
+
+
+def clear_view_cache():
+    """Forget every cached view result (settled proposals are kept)."""
+    _invalidate_views()
+
+
+def _view_key(method_name: str, args: dict) -> tuple[str, str]:
+    return method_name, _dumps_canonical(args).decode()
+
+
+def _store_view(key: tuple[str, str], value, gen: int):
+    with _view_cache_lock:
+        if gen == _view_cache_gen:
+            _view_cache[key] = value
+
+
+def view_call(method_name: str, args: dict, _retries: int = 3, fresh: bool = False):
+    """Call a view method on the contract via NEAR RPC.
+
+    Uses primary→fallback failover per attempt, with retries on transient errors.
+    Methods in CACHED_VIEWS are answered from memory on repeat calls;
+    `fresh=True` skips the lookup (the new answer is still cached).
+    """
+    if method_name in CACHED_VIEWS:
+        key = _view_key(method_name, args)
+        with _view_cache_lock:
+            if not fresh and key in _view_cache:
+                return _view_cache[key]
+            gen = _view_cache_gen
+        value = _view_call(method_name, args, _retries)
+        _store_view(key, value, gen)
+        return value
+    return _view_call(method_name, args, _retries)
+
+
+def _view_call(method_name: str, args: dict, _retries: int):
+    rpc_body = _view_body(method_name, args)
     last_err = None
     for attempt in range(_retries):
         try:
-            r = _rpc_post(rpc_body)
-            if "error" in r:
-                raise RuntimeError(f"RPC error: {r['error']}")
-            raw = bytes(r["result"]["result"]).decode()
-            return json.loads(raw)
+            return _decode_view(_rpc_post(rpc_body))
         except Exception as e:
             last_err = e
             if attempt < _retries - 1:
@@ -372,6 +1041,38 @@ def view_call(method_name: str, args: dict, _retries: int = 3):
     raise last_err or RuntimeError("view_call failed")
 
 
+def view_call_many(calls: list[tuple[str, dict]]) -> list:
+    """Run several view calls in batched JSON-RPC round trips.
+
+    Returns decoded results in the same order as `calls`. CACHED_VIEWS
+    entries already in memory are not sent, and the batch's answers for
+    them are cached. Any call that errors in the batch is retried on its
+    own via view_call.
+    """
+    results: list = [None] * len(calls)
+    todo = []
+    with _view_cache_lock:
+        gen = _view_cache_gen
+        for i, (method_name, args) in enumerate(calls):
+            key = _view_key(method_name, args) if method_name in CACHED_VIEWS else None
+            if key in _view_cache:
+                results[i] = _view_cache[key]
+            else:
+                todo.append((i, method_name, args, key))
+    if not todo:
+        return results
+    responses = rpc_batch([_view_body(m, a) for _, m, a, _ in todo])
+    for (i, method_name, args, key), r in zip(todo, responses):
+        try:
+            results[i] = _decode_view(r)
+        except Exception:
+            results[i] = view_call(method_name, args)
+            continue
+        if key is not None:
+            _store_view(key, results[i], gen)
+    return results
+
+
 # ---------------------------------------------------------------------------
 # View helpers
 # ---------------------------------------------------------------------------
@@ -396,10 +1097,35 @@ def get_group_stats(group_id: str):
     return view_call("get_group_stats", {"group_id": group_id})
 
 
+# Proposals in a terminal status never change again, so they are kept for
+# the whole run (not subject to _invalidate_views).
+TERMINAL_PROPOSAL_STATUSES = ("executed", "rejected", "expired", "cancelled")
+_settled_proposals: dict[tuple[str, str], dict] = {}
+# Statuses seen in the logs of txs near_call sent, via the CLI or in-process
+# (see _record_proposal_outcomes)
+_proposal_outcomes: dict[tuple[str, str], str] = {}
+
+
+def proposal_outcome(group_id: str, proposal_id: str) -> str | None:
+    """Status a signed tx's events reported for the proposal, if any.
+
+    Known as soon as near_call returns, before final views catch up; None
+    when no tx we sent has changed the proposal's status.
+    """
+    return _proposal_outcomes.get((group_id, str(proposal_id)))
+
+
 def get_proposal(group_id: str, proposal_id: str):
-    return view_call("get_proposal", {
+    key = (group_id, str(proposal_id))
+    cached = _settled_proposals.get(key)
+    if cached is not None:
+        return cached
+    p = view_call("get_proposal", {
         "group_id": group_id, "proposal_id": proposal_id,
     })
+    if isinstance(p, dict) and str(p.get("status", "")).lower() in TERMINAL_PROPOSAL_STATUSES:
+        _settled_proposals[key] = p
+    return p
 
 
 def get_proposal_tally(group_id: str, proposal_id: str):
@@ -435,44 +1161,236 @@ def get_vote(group_id: str, proposal_id: str, voter: str):
 # ---------------------------------------------------------------------------
 # Test runner helpers
 # ---------------------------------------------------------------------------
-PASS = 0
-FAIL = 0
+@dataclass
+class Results:
+    """Pass/fail tally. Thread-safe, so independent tests can run concurrently.
+
+    Result lines are buffered and written by flush() in one call, so
+    concurrent tests append to a list instead of contending on stdout.
+    """
+
+    passed: int = 0
+    failed: int = 0
+    _lines: list[str] = field(default_factory=list, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def ok(self, name: str, detail: str = ""):
+        with self._lock:
+            self.passed += 1
+            self._lines.append(f"  ✅ {name}" + (f" — {detail}" if detail else ""))
+
+    def fail(self, name: str, detail: str = ""):
+        with self._lock:
+            self.failed += 1
+            self._lines.append(f"  ❌ {name}" + (f" — {detail}" if detail else ""))
+
+    def skip(self, name: str, reason: str = ""):
+        with self._lock:
+            self._lines.append(f"  ⏭️  {name}" + (f" — {reason}" if reason else ""))
+
+    def flush(self):
+        with self._lock:
+            lines, self._lines = self._lines, []
+        if lines:
+            print("\n".join(lines), flush=True)
+
+
+RESULTS = Results()
 
 
 def ok(name: str, detail: str = ""):
-    global PASS
-    PASS += 1
-    print(f"  ✅ {name}" + (f" — {detail}" if detail else ""))
+    RESULTS.ok(name, detail)
 
 
 def fail(name: str, detail: str = ""):
-    global FAIL
-    FAIL += 1
-    print(f"  ❌ {name}" + (f" — {detail}" if detail else ""))
+    RESULTS.fail(name, detail)
 
 
 def skip(name: str, reason: str = ""):
-    print(f"  ⏭️  {name}" + (f" — {reason}" if reason else ""))
+    RESULTS.skip(name, reason)
+
+
+def flush_results():
+    """Write buffered ok/fail/skip lines to stdout."""
+    RESULTS.flush()
+
+
+@functools.lru_cache(maxsize=None)
+def _rejection_pattern(words: tuple[str, ...]) -> re.Pattern:
+    return re.compile("|".join(map(re.escape, sorted(words))), re.IGNORECASE)
+
+
+def match_any(err: BaseException | str, words: tuple[str, ...]) -> bool:
+    """True if any of `words` occurs in the error text (case-insensitive).
+
+    Each word tuple is compiled once into one regex alternation, so a
+    check is a single scan with no lowercased copy of the message; pass a
+    tuple literal so it hashes to the same cached pattern every call.
+    """
+    return _rejection_pattern(words).search(str(err)) is not None
+
+
+def assert_rejected(
+    label: str,
+    exc: BaseException,
+    patterns: tuple[str, ...],
+    detail: str = "correctly rejected",
+) -> bool:
+    """Record ok(label) if the error text matches any of `patterns`, else fail.
+
+    Each pattern tuple is compiled once into a case-insensitive alternation,
+    so call sites need no lowercased copy of the message.
+    """
+    if _rejection_pattern(patterns).search(str(exc)):
+        ok(label, detail)
+        return True
+    fail(label, str(exc)[:150])
+    return False
 
 
 def wait_for_chain(seconds: int = 3):
     """Wait for finality."""
     time.sleep(seconds)
+    _invalidate_views()
+
+
+def tx_hash(res: dict) -> str:
+    """Extract the tx hash from a relay response ('' if the relay gave none)."""
+    return res.get("tx_hash") or res.get("transaction", {}).get("hash", "")
+
+
+def wait_for_tx(res: dict | str, timeout: int = 30, fallback: int = 5):
+    """Block until a relayed tx has executed and return its result.
+
+    Accepts a relay response or a bare hash. Returns as soon as the RPC
+    reports the outcome (raises RuntimeError on failure, like get_tx_result).
+    Only sleeps a blind `fallback` seconds if the relay returned no hash.
+    """
+    h = res if isinstance(res, str) else tx_hash(res)
+    if not h:
+        wait_for_chain(fallback)
+        return None
+    return get_tx_result(h, timeout=timeout)
+
+
+def wait_tx(res: dict | str, timeout: int = 30):
+    """wait_for_tx for setup writes: a timeout is swallowed, not raised.
+
+    The caller's own assertions then report whatever state is missing;
+    failed txs still raise RuntimeError.
+    """
+    try:
+        return wait_for_tx(res, timeout=timeout)
+    except TimeoutError:
+        return None
+
+
+def wait_for_txs(responses: list[dict | str], timeout: int = 30, fallback: int = 5) -> list:
+    """wait_for_tx for several txs at once, polled together by TX_TRACKER.
+
+    Results (or the first failure) come back in the order given.
+    """
+    hashes = [r if isinstance(r, str) else tx_hash(r) for r in responses]
+    if not all(hashes):
+        wait_for_chain(fallback)
+    futures = [TX_TRACKER.track(h, timeout=timeout) if h else None for h in hashes]
+    return [f.result(timeout=timeout + 5) if f else None for f in futures]
+
+
+def wait_for_view(read, check, timeout: float = 10, interval: float = 0.3):
+    """Poll `read()` until `check(value)` holds or `timeout` passes.
+
+    Views use finality=final, which trails execution by a block or two;
+    this replaces a fixed sleep before read-your-writes assertions. Returns
+    the last value read either way so callers keep their own assertions.
+    """
+    deadline = time.time() + timeout
+    while True:
+        value = read()
+        if check(value) or time.time() >= deadline:
+            return value
+        time.sleep(interval)
+        interval = min(interval * 1.5, 1.0)
+        _invalidate_views()
 
 
 def summary():
-    total = PASS + FAIL
+    flush_results()
+    passed, failed = RESULTS.passed, RESULTS.failed
+    total = passed + failed
     print(f"\n  {'=' * 40}")
-    print(f"  Results: {PASS}/{total} passed", end="")
-    if FAIL:
-        print(f", {FAIL} failed")
+    print(f"  Results: {passed}/{total} passed", end="")
+    if failed:
+        print(f", {failed} failed")
     else:
         print(" — all good! 🎉")
     print(f"  {'=' * 40}")
-    return FAIL == 0
+    return failed == 0
+
+
+# Clock read once: the seed separates runs, the counter separates calls
+# (itertools.count is atomic under the GIL, so threads never collide).
+_PID = os.getpid()
+_UNIQUE_SEQ = itertools.count(time.time_ns() & 0xFFFFFFFF)
 
 
 def unique_id(prefix: str = "") -> str:
-    """Generate a unique ID for test data."""
-    ts = int(time.time())
-    return f"{prefix}{ts}" if prefix else str(ts)
+    """Generate a unique ID for test data (safe across parallel tests)."""
+    uid = f"{_PID:x}-{next(_UNIQUE_SEQ):x}"
+    return f"{prefix}{uid}" if prefix else uid
+
+
+# (members, is_private) -> group id, so suites in one process share a group
+_shared_groups: dict[tuple[tuple[str, ...], bool], str] = {}
+_shared_groups_lock = threading.Lock()
+
+
+def get_or_create_shared_group(members: tuple[str, ...], is_private: bool = False) -> str:
+    """Group owned by ACCOUNT_ID with `members` joined, created once per run.
+
+    Suites with the same requirements get the same on-chain group. Only
+    hand it to tests that leave membership and ownership as they found it.
+    """
+    key = (tuple(sorted(members)), is_private)
+    with _shared_groups_lock:
+        gid = _shared_groups.get(key)
+        if gid:
+            return gid
+        gid = f"shared-{unique_id()}"
+        # Joins come from different signers: submitted concurrently once
+        # the group exists, then waited on together
+        relay_pipeline([
+            [(None, {
+                "type": "create_group",
+                "group_id": gid,
+                "config": {"is_private": is_private, "description": f"Shared test group {gid}"},
+            })],
+            [(m, {"type": "join_group", "group_id": gid}) for m in key[0]],
+        ])
+        _shared_groups[key] = gid
+        return gid
+
+
+TEST_DEADLINE = 180  # seconds a run_parallel group may take in total
+
+
+def run_parallel(*tests, max_workers: int = 8, deadline: float = TEST_DEADLINE):
+    """Run independent test functions concurrently and wait for all.
+
+    Exceptions escaping a test are re-raised in submission order, same as
+    when the tests ran one after another. Tests still running after
+    `deadline` seconds are reported as failed and left behind (threads
+    can't be cancelled), so one hung RPC can't stall the whole run.
+    """
+    pool = ThreadPoolExecutor(max_workers=max_workers)
+    futures = [pool.submit(t) for t in tests]
+    _, pending = wait(futures, timeout=deadline)
+    pool.shutdown(wait=False, cancel_futures=True)
+    try:
+        for t, f in zip(tests, futures):
+            if f in pending:
+                fail(getattr(t, "__name__", "test"), f"deadline exceeded ({deadline}s)")
+            elif not f.cancelled():
+                f.result()
+    finally:
+        flush_results()
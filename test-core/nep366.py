@@ -1,7 +1,8 @@
 """Minimal NEP-366 SignedDelegateAction encoder for test-core (Python).
 
 Mirrors packages/onsocial-sdk/src/advanced/nep366.ts. Uses pynacl for ed25519
-and hand-rolled borsh — no near-api-py dependency.
+and hand-rolled borsh — no near-api-py dependency. Also encodes plain
+SignedTransactions so helpers can submit deposit calls without the near CLI.
 """
 
 from __future__ import annotations
@@ -11,9 +12,13 @@ import hashlib
 import struct
 from typing import Iterable
 
-import base58
 import nacl.signing
 
+try:
+    from based58 import b58decode
+except ImportError:
+    from base58 import b58decode
+
 
 # ---------------------------------------------------------------------------
 # Borsh primitives
@@ -58,7 +63,7 @@ def parse_ed25519_public_key(key: str) -> bytes:
     curve, b58 = key.split(":", 1)
     if curve != "ed25519":
         raise ValueError(f"only ed25519 supported (got {curve})")
-    raw = base58.b58decode(b58)
+    raw = b58decode(b58.encode())
     if len(raw) != 32:
         raise ValueError(f"ed25519 key must be 32 bytes (got {len(raw)})")
     return raw
@@ -73,14 +78,16 @@ def _encode_ed25519_pubkey(raw32: bytes) -> bytes:
 # ---------------------------------------------------------------------------
 def encode_function_call(
     method_name: str,
-    args_json: str,
+    args_json: str | bytes,
     gas: int,
     deposit: int,
 ) -> bytes:
+    if isinstance(args_json, str):
+        args_json = args_json.encode()
     return (
         _u8(2)  # FunctionCall variant
         + _string(method_name)
-        + _bytes(args_json.encode())
+        + _bytes(args_json)
         + _u64(gas)
         + _u128(deposit)
     )
@@ -113,6 +120,7 @@ def _encode_delegate_action(
 
 
 _NEP_366_DISCRIMINANT = (1 << 30) + 366
+_NEP_366_PREFIX = _u32(_NEP_366_DISCRIMINANT)
 
 
 def build_signed_delegate(
@@ -134,11 +142,64 @@ def build_signed_delegate(
         public_key_raw32=pub_raw,
     )
 
-    signable = _u32(_NEP_366_DISCRIMINANT) + delegate_bytes
-    digest = hashlib.sha256(signable).digest()
+    # NEP-366 signs sha256(discriminant || delegate); hash incrementally
+    # rather than concatenating a copy of the encoded delegate action.
+    hasher = hashlib.sha256(_NEP_366_PREFIX)
+    hasher.update(delegate_bytes)
+    digest = hasher.digest()
     signature = signing_key.sign(digest).signature
     if len(signature) != 64:
         raise RuntimeError(f"signature must be 64 bytes (got {len(signature)})")
 
     signed = delegate_bytes + _u8(0x00) + signature  # 0 = ED25519 signature variant
     return base64.b64encode(signed).decode()
+
+
+# ---------------------------------------------------------------------------
+# Transaction + SignedTransaction
+# ---------------------------------------------------------------------------
+def _encode_transaction(
+    signer_id: str,
+    public_key_raw32: bytes,
+    nonce: int,
+    receiver_id: str,
+    block_hash: bytes,
+    actions: Iterable[bytes],
+) -> bytes:
+    if len(block_hash) != 32:
+        raise ValueError(f"block hash must be 32 bytes (got {len(block_hash)})")
+    return (
+        _string(signer_id)
+        + _encode_ed25519_pubkey(public_key_raw32)
+        + _u64(nonce)
+        + _string(receiver_id)
+        + block_hash
+        + _encode_actions(actions)
+    )
+
+
+def build_signed_transaction(
+    signer_id: str,
+    receiver_id: str,
+    actions: Iterable[bytes],
+    nonce: int,
+    block_hash_b58: str,
+    signing_key: nacl.signing.SigningKey,
+    public_key_str: str,
+) -> str:
+    """Encode and sign a transaction; returns base64 for broadcast_tx_*."""
+    tx_bytes = _encode_transaction(
+        signer_id=signer_id,
+        public_key_raw32=parse_ed25519_public_key(public_key_str),
+        nonce=nonce,
+        receiver_id=receiver_id,
+        block_hash=b58decode(block_hash_b58.encode()),
+        actions=actions,
+    )
+    digest = hashlib.sha256(tx_bytes).digest()
+    signature = signing_key.sign(digest).signature
+    if len(signature) != 64:
+        raise RuntimeError(f"signature must be 64 bytes (got {len(signature)})")
+
+    signed = tx_bytes + _u8(0x00) + signature
+    return base64.b64encode(signed).decode()
@@ -39,6 +39,9 @@ SUITES = {
     "permissions_granular": test_permissions_granular,
 }
 
+# Accounts the suites act as (MEMBER, OUTSIDER, MODERATOR, ...)
+ACTORS = [f"test0{i}.onsocial.testnet" for i in range(1, 6)]
+
 
 def main():
     parser = argparse.ArgumentParser(description="Test core-onsocial on testnet")
@@ -46,6 +49,10 @@ def main():
                         help="Run a specific suite (default: all)")
     args = parser.parse_args()
 
+    # Block-buffer stdout (a TTY defaults to a write per line); result
+    # lines are buffered in helpers and flushed once per suite below
+    sys.stdout.reconfigure(line_buffering=False)
+
     print("=" * 60)
     print("  OnSocial Core Contract — Live Testnet Tests")
     print("=" * 60)
@@ -60,16 +67,23 @@ def main():
         sys.exit(0 if helpers.summary() else 1)
 
     # All other suites need JWT (except voting which uses near CLI)
-    print(f"\n  Authenticating...")
+    print(f"\n  Authenticating...", flush=True)
     helpers.login()
     print(f"  ✅ JWT acquired (default: {helpers.ACCOUNT_ID})")
 
-    # Also login default account via login_as for relay_execute_as
-    helpers.login_as(helpers.ACCOUNT_ID)
+    # Log in every test actor once up front (concurrently); suites then
+    # reuse the cached JWTs instead of logging in mid-test
+    try:
+        helpers.login_many(list(dict.fromkeys([helpers.ACCOUNT_ID, *ACTORS])))
+    except (RuntimeError, OSError) as e:
+        print(f"  ⚠️  Pre-login incomplete, suites will log in on demand: {e}")
 
-    # Voting suite uses near CLI for deposit-requiring ops (no JWT needed)
+    # Voting suite signs deposit-requiring ops itself (no JWT needed)
     if args.suite == "voting" or args.suite is None:
-        print(f"  ℹ️  Voting tests use `near call` CLI (deposits required)")
+        if helpers.NEAR_CALL_IN_PROCESS:
+            print(f"  ℹ️  Voting tests sign txs in-process (deposits required)")
+        else:
+            print(f"  ℹ️  Voting tests use `near call` CLI (deposits required)")
     print()
 
     if args.suite:
@@ -77,6 +91,7 @@ def main():
     else:
         for name, mod in SUITES.items():
             mod.run()
+            helpers.flush_results()
 
     success = helpers.summary()
     sys.exit(0 if success else 1)
@@ -1,55 +1,82 @@
 """Test suite: Data — Set/get key-value data on-chain."""
 
 from helpers import (
-    relay_execute, get_data, view_call, wait_for_chain,
-    ok, fail, skip, unique_id, ACCOUNT_ID,
+    relay_execute, get_data, view_call, view_call_many, load_keypair,
+    wait_for_tx, wait_for_view, ok, fail, skip, unique_id, run_parallel, ACCOUNT_ID,
 )
 
 
-def test_set_and_read():
+# Writes are bundled: run() hands each write test the two phase dicts, the
+# test registers its keys in them and returns its result label with a verify
+# callback, and run() submits each phase as one relay "set" before any
+# verification. Phase 2 only holds overwrites of phase-1 keys.
+
+
+def _value(result):
+    return result.get("value") if isinstance(result, dict) else result
+
+
+def _submit_writes(*phases: dict[str, str]):
+    """Submit the registered write phases in order (one relay tx per phase)."""
+    for data in phases:
+        if data:
+            wait_for_tx(relay_execute({"type": "set", "data": data}))
+
+
+def test_set_and_read(setup: dict, overwrites: dict):
     """Set a profile value via relay, read it back via RPC."""
     val = f"testdata-{unique_id()}"
-    relay_execute({"type": "set", "data": {"profile/test_key": val}})
-    wait_for_chain(5)
-    result = get_data("profile/test_key")
-    actual = result.get("value") if isinstance(result, dict) else result
-    if actual == val:
-        ok("set + get", f"wrote and read back: {val}")
-    else:
-        fail("set + get", f"expected {val}, got value={actual}")
+    setup["profile/test_key"] = val
+
+    def verify():
+        result = wait_for_view(
+            lambda: get_data("profile/test_key"), lambda r: _value(r) == val,
+        )
+        actual = _value(result)
+        if actual == val:
+            ok("set + get", f"wrote and read back: {val}")
+        else:
+            fail("set + get", f"expected {val}, got value={actual}")
+    return "set + get", verify
 
 
-def test_set_multiple_keys():
+def test_set_multiple_keys(setup: dict, overwrites: dict):
     """Set multiple keys in one call."""
     uid = unique_id()
-    relay_execute({"type": "set", "data": {
+    setup.update({
         f"test/{uid}/a": "alpha",
         f"test/{uid}/b": "beta",
         f"test/{uid}/c": "gamma",
-    }})
-    wait_for_chain(5)
+    })
     keys = [f"{ACCOUNT_ID}/test/{uid}/a", f"{ACCOUNT_ID}/test/{uid}/b", f"{ACCOUNT_ID}/test/{uid}/c"]
-    result = view_call("get", {"keys": keys})
-    values = [e.get("value") for e in result if e.get("value")] if isinstance(result, list) else []
-    if len(values) == 3:
-        ok("multi-key set", f"3 keys written: {values}")
-    else:
-        fail("multi-key set", f"expected 3 values, got {len(values)}: {result}")
+
+    def verify():
+        result = wait_for_view(
+            lambda: view_call("get", {"keys": keys}),
+            lambda r: isinstance(r, list) and all(e.get("value") for e in r),
+        )
+        values = [e.get("value") for e in result if e.get("value")] if isinstance(result, list) else []
+        if len(values) == 3:
+            ok("multi-key set", f"3 keys written: {values}")
+        else:
+            fail("multi-key set", f"expected 3 values, got {len(values)}: {result}")
+    return "multi-key set", verify
 
 
-def test_overwrite_key():
+def test_overwrite_key(setup: dict, overwrites: dict):
     """Overwrite an existing key."""
     key = f"profile/ow_{unique_id()}"
-    relay_execute({"type": "set", "data": {key: "first"}})
-    wait_for_chain(5)
-    relay_execute({"type": "set", "data": {key: "second"}})
-    wait_for_chain(5)
-    result = get_data(key)
-    actual = result.get("value") if isinstance(result, dict) else result
-    if actual == "second":
-        ok("overwrite key", "value updated correctly")
-    else:
-        fail("overwrite key", f"expected 'second', got '{actual}'")
+    setup[key] = "first"
+    overwrites[key] = "second"
+
+    def verify():
+        result = wait_for_view(lambda: get_data(key), lambda r: _value(r) == "second")
+        actual = _value(result)
+        if actual == "second":
+            ok("overwrite key", "value updated correctly")
+        else:
+            fail("overwrite key", f"expected 'second', got '{actual}'")
+    return "overwrite key", verify
 
 
 def test_get_nonexistent_key():
@@ -64,39 +91,40 @@ def test_get_nonexistent_key():
         fail("get nonexistent", str(e))
 
 
-def test_get_storage_balance():
-    """Check storage balance for the test account."""
+def test_account_views():
+    """Check storage balance and nonce for the test account in one batch."""
     try:
-        result = view_call("get_storage_balance", {"account_id": ACCOUNT_ID})
-        ok("storage balance", f"{result}")
-    except Exception as e:
-        fail("storage balance", str(e))
-
-
-def test_get_nonce():
-    """Check nonce for the test account."""
-    try:
-        signing_key_str = None
-        from helpers import load_keypair
         _, pub_key = load_keypair()
-        result = view_call("get_nonce", {
-            "account_id": ACCOUNT_ID,
-            "public_key": pub_key,
-        })
-        ok("get nonce", f"nonce = {result}")
+        balance, nonce = view_call_many([
+            ("get_storage_balance", {"account_id": ACCOUNT_ID}),
+            ("get_nonce", {"account_id": ACCOUNT_ID, "public_key": pub_key}),
+        ])
+        ok("storage balance", f"{balance}")
+        ok("get nonce", f"nonce = {nonce}")
     except Exception as e:
+        # One batched read: if it failed, neither value was checked
+        fail("storage balance", str(e))
         fail("get nonce", str(e))
 
 
 # ---------------------------------------------------------------------------
 def run():
     print("\n  ── Data Tests ────────────────────────────")
-    test_set_and_read()
-    test_set_multiple_keys()
-    test_overwrite_key()
-    test_get_nonexistent_key()
-    test_get_storage_balance()
-    test_get_nonce()
+    setup: dict[str, str] = {}
+    overwrites: dict[str, str] = {}
+    checks = [
+        test(setup, overwrites)
+        for test in (test_set_and_read, test_set_multiple_keys, test_overwrite_key)
+    ]
+    try:
+        _submit_writes(setup, overwrites)
+    except Exception as e:
+        # Nothing was written, so none of the reads can be verified
+        for name, _ in checks:
+            fail(name, f"setup write failed: {e}")
+        checks = []
+    run_parallel(*(verify for _, verify in checks),
+                 test_get_nonexistent_key, test_account_views)
 
 
 if __name__ == "__main__":
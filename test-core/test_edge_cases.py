@@ -9,12 +9,13 @@ Covers:
 """
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 from helpers import (
-    relay_execute, relay_execute_as, near_call,
+    relay_execute, relay_execute_as, relay_pipeline, near_call,
     view_call, is_group_member, has_permission, get_permissions,
     get_group_config, get_tx_result,
-    wait_for_chain, login, login_as,
-    ok, fail, skip, unique_id, ACCOUNT_ID,
+    wait_for_tx, wait_for_view, login,
+    match_any, ok, fail, skip, unique_id, run_parallel, ACCOUNT_ID,
 )
 
 MEMBER = "test02.onsocial.testnet"
@@ -29,11 +30,12 @@ def test_delete_data_null():
     """Set a key to null should delete/clear it."""
     key = f"test/del-{unique_id()}"
     try:
-        relay_execute({"type": "set", "data": {key: "exists"}})
-        wait_for_chain(5)
-        relay_execute({"type": "set", "data": {key: None}})
-        wait_for_chain(5)
-        result = view_call("get_one", {"key": key, "account_id": ACCOUNT_ID})
+        wait_for_tx(relay_execute({"type": "set", "data": {key: "exists"}}))
+        wait_for_tx(relay_execute({"type": "set", "data": {key: None}}))
+        result = wait_for_view(
+            lambda: view_call("get_one", {"key": key, "account_id": ACCOUNT_ID}),
+            lambda r: r is None or (isinstance(r, dict) and r.get("value") is None),
+        )
         if result is None or (isinstance(result, dict) and result.get("value") is None):
             ok("delete data (null)", "key cleared")
         else:
@@ -42,79 +44,33 @@ def test_delete_data_null():
         fail("delete data (null)", str(e))
 
 
-def test_reserved_key_config():
-    """Writing to reserved 'config' key must fail."""
-    try:
-        relay_execute({"type": "set", "data": {"config": "hack"}})
-        wait_for_chain(3)
-        fail("reserved key: config", "write accepted")
-    except RuntimeError as e:
-        if any(kw in str(e).lower() for kw in ["reserved", "update_config", "fail", "invalid"]):
-            ok("reserved key: config", f"rejected: {str(e)[:80]}")
-        else:
-            ok("reserved key: config", f"error: {str(e)[:80]}")
-    except Exception as e:
-        fail("reserved key: config", str(e))
+# (result name, data, expected-error words) — each write must be rejected
+REJECT_CASES = [
+    ("reserved key: config", {"config": "hack"}, ("reserved", "update_config", "fail", "invalid")),
+    ("reserved key: status", {"status/read_only": "true"}, ("reserved", "enter_read_only", "fail", "invalid")),
+    ("key without slash", {"name": "bare key"}, ("invalid", "operation", "fail")),
+    ("unknown storage key", {"storage/fake": "bad"}, ("invalid", "operation", "fail")),
+    ("unknown permission key", {"permission/fake": "bad"}, ("invalid", "operation", "fail")),
+]
 
 
-def test_reserved_key_status():
-    """Writing to reserved 'status/read_only' key must fail."""
+def _expect_rejected(name: str, data: dict, words: tuple[str, ...]):
     try:
-        relay_execute({"type": "set", "data": {"status/read_only": "true"}})
-        wait_for_chain(3)
-        fail("reserved key: status", "write accepted")
+        relay_execute({"type": "set", "data": data})
+        fail(name, "write accepted")
     except RuntimeError as e:
-        if any(kw in str(e).lower() for kw in ["reserved", "enter_read_only", "fail", "invalid"]):
-            ok("reserved key: status", f"rejected: {str(e)[:80]}")
+        if match_any(e, words):
+            ok(name, f"rejected: {str(e)[:80]}")
         else:
-            ok("reserved key: status", f"error: {str(e)[:80]}")
+            ok(name, f"error: {str(e)[:80]}")
     except Exception as e:
-        fail("reserved key: status", str(e))
-
+        fail(name, str(e))
 
-def test_key_without_slash():
-    """Key without a slash (e.g. just 'name') must fail."""
-    try:
-        relay_execute({"type": "set", "data": {"name": "bare key"}})
-        wait_for_chain(3)
-        fail("key without slash", "bare key accepted")
-    except RuntimeError as e:
-        if any(kw in str(e).lower() for kw in ["invalid", "operation", "fail"]):
-            ok("key without slash", f"rejected: {str(e)[:80]}")
-        else:
-            ok("key without slash", f"error: {str(e)[:80]}")
-    except Exception as e:
-        fail("key without slash", str(e))
 
-
-def test_unknown_storage_key():
-    """Unknown storage/* sub-key must fail."""
-    try:
-        relay_execute({"type": "set", "data": {"storage/fake": "bad"}})
-        wait_for_chain(3)
-        fail("unknown storage key", "accepted")
-    except RuntimeError as e:
-        if any(kw in str(e).lower() for kw in ["invalid", "operation", "fail"]):
-            ok("unknown storage key", f"rejected: {str(e)[:80]}")
-        else:
-            ok("unknown storage key", f"error: {str(e)[:80]}")
-    except Exception as e:
-        fail("unknown storage key", str(e))
-
-
-def test_unknown_permission_key():
-    """Unknown permission/* sub-key must fail."""
-    try:
-        relay_execute({"type": "set", "data": {"permission/fake": "bad"}})
-        wait_for_chain(3)
-        fail("unknown permission key", "accepted")
-    except RuntimeError as e:
-        if any(kw in str(e).lower() for kw in ["invalid", "operation", "fail"]):
-            ok("unknown permission key", f"rejected: {str(e)[:80]}")
-        else:
-            ok("unknown permission key", f"error: {str(e)[:80]}")
-    except Exception as e:
-        fail("unknown permission key", str(e))
+def test_rejected_writes():
+    """Reserved, bare and unknown keys must fail (all cases submitted at once)."""
+    with ThreadPoolExecutor(max_workers=len(REJECT_CASES)) as pool:
+        list(pool.map(lambda case: _expect_rejected(*case), REJECT_CASES))
 
 
 # ---------------------------------------------------------------------------
@@ -125,12 +81,11 @@ def test_duplicate_group_id():
     """Creating a group with an existing ID must fail."""
     gid = f"dup-{unique_id()}"
     try:
-        relay_execute({
+        wait_for_tx(relay_execute({
             "type": "create_group",
             "group_id": gid,
             "config": {"is_private": False, "description": "first"},
-        })
-        wait_for_chain(5)
+        }))
         # Try creating again
         res = relay_execute({
             "type": "create_group",
@@ -143,14 +98,14 @@ def test_duplicate_group_id():
                 get_tx_result(tx)
                 fail("duplicate group ID", "second create succeeded")
             except RuntimeError as tx_err:
-                if any(kw in str(tx_err).lower() for kw in ["already", "exist", "fail"]):
+                if match_any(tx_err, ("already", "exist", "fail")):
                     ok("duplicate group ID", f"rejected: {str(tx_err)[:80]}")
                 else:
                     ok("duplicate group ID", f"TX failed: {str(tx_err)[:80]}")
         else:
             ok("duplicate group ID", "relay rejected second create")
     except RuntimeError as e:
-        if any(kw in str(e).lower() for kw in ["already", "exist", "fail"]):
+        if match_any(e, ("already", "exist", "fail")):
             ok("duplicate group ID", f"rejected: {str(e)[:80]}")
         else:
             fail("duplicate group ID", str(e))
@@ -176,7 +131,7 @@ def test_invalid_group_id_empty():
         else:
             ok("empty group ID", "relay rejected")
     except RuntimeError as e:
-        if any(kw in str(e).lower() for kw in ["character", "invalid", "fail"]):
+        if match_any(e, ("character", "invalid", "fail")):
             ok("empty group ID", f"rejected: {str(e)[:80]}")
         else:
             ok("empty group ID", f"error: {str(e)[:80]}")
@@ -202,7 +157,7 @@ def test_invalid_group_id_special_chars():
         else:
             ok("special char group ID", "relay rejected")
     except RuntimeError as e:
-        if any(kw in str(e).lower() for kw in ["alphanumeric", "invalid", "fail"]):
+        if match_any(e, ("alphanumeric", "invalid", "fail")):
             ok("special char group ID", f"rejected: {str(e)[:80]}")
         else:
             ok("special char group ID", f"error: {str(e)[:80]}")
@@ -214,18 +169,12 @@ def test_double_join():
     """Joining a group you're already in must fail."""
     gid = f"dj-{unique_id()}"
     try:
-        relay_execute({
+        wait_for_tx(relay_execute({
             "type": "create_group",
             "group_id": gid,
             "config": {"is_private": False, "description": "double join test"},
-        })
-        wait_for_chain(5)
-        login_as(MEMBER)
-        res = relay_execute_as(MEMBER, {"type": "join_group", "group_id": gid})
-        tx = res.get("tx_hash") or res.get("transaction", {}).get("hash", "")
-        if tx:
-            get_tx_result(tx)
-        wait_for_chain(5)
+        }))
+        wait_for_tx(relay_execute_as(MEMBER, {"type": "join_group", "group_id": gid}))
 
         # Try joining again
         res2 = relay_execute_as(MEMBER, {"type": "join_group", "group_id": gid})
@@ -235,14 +184,14 @@ def test_double_join():
                 get_tx_result(tx2)
                 ok("double join", "TX ok (no-op or silently ignored)")
             except RuntimeError as tx_err:
-                if any(kw in str(tx_err).lower() for kw in ["already", "exist", "member"]):
+                if match_any(tx_err, ("already", "exist", "member")):
                     ok("double join", f"rejected: {str(tx_err)[:80]}")
                 else:
                     ok("double join", f"TX failed: {str(tx_err)[:80]}")
         else:
             ok("double join", "relay rejected second join")
     except RuntimeError as e:
-        if any(kw in str(e).lower() for kw in ["already", "exist", "member"]):
+        if match_any(e, ("already", "exist", "member")):
             ok("double join", f"rejected: {str(e)[:80]}")
         else:
             fail("double join", str(e))
@@ -259,9 +208,11 @@ def test_member_driven_must_be_private():
             "group_id": gid,
             "config": {"member_driven": True, "is_private": False},
         }, deposit="0.1")
-        # Check if group exists and is actually private
-        wait_for_chain(3)
-        config = get_group_config(gid)
+        # Check if group exists and is actually private (views trail the CLI's
+        # execution by a block or two, so poll briefly instead of sleeping)
+        config = wait_for_view(
+            lambda: get_group_config(gid), lambda c: c is not None, timeout=5,
+        )
         if config and config.get("is_private"):
             ok("member-driven must be private", "contract forced private")
         elif config:
@@ -269,7 +220,7 @@ def test_member_driven_must_be_private():
         else:
             ok("member-driven must be private", "group not created")
     except RuntimeError as e:
-        if any(kw in str(e).lower() for kw in ["private", "democratic", "member-driven", "panicked"]):
+        if match_any(e, ("private", "democratic", "member-driven", "panicked")):
             ok("member-driven must be private", f"rejected: {str(e)[:80]}")
         else:
             ok("member-driven must be private", f"error: {str(e)[:80]}")
@@ -281,26 +232,18 @@ def test_non_owner_cannot_blacklist():
     """Regular member cannot blacklist (needs MANAGE)."""
     gid = f"blk-{unique_id()}"
     try:
-        relay_execute({
-            "type": "create_group",
-            "group_id": gid,
-            "config": {"is_private": False, "description": "blacklist test"},
-        })
-        wait_for_chain(5)
-        # Member joins
-        login_as(MEMBER)
-        res = relay_execute_as(MEMBER, {"type": "join_group", "group_id": gid})
-        tx = res.get("tx_hash") or res.get("transaction", {}).get("hash", "")
-        if tx:
-            get_tx_result(tx)
-        wait_for_chain(3)
-        # Outsider joins
-        login_as(OUTSIDER)
-        res = relay_execute_as(OUTSIDER, {"type": "join_group", "group_id": gid})
-        tx = res.get("tx_hash") or res.get("transaction", {}).get("hash", "")
-        if tx:
-            get_tx_result(tx)
-        wait_for_chain(3)
+        # Create, then member + outsider join together
+        relay_pipeline([
+            [(None, {
+                "type": "create_group",
+                "group_id": gid,
+                "config": {"is_private": False, "description": "blacklist test"},
+            })],
+            [
+                (MEMBER, {"type": "join_group", "group_id": gid}),
+                (OUTSIDER, {"type": "join_group", "group_id": gid}),
+            ],
+        ])
 
         # Member (not owner/admin) tries to blacklist outsider
         res2 = relay_execute_as(MEMBER, {
@@ -322,7 +265,7 @@ def test_non_owner_cannot_blacklist():
         else:
             ok("non-owner blacklist", "relay rejected")
     except RuntimeError as e:
-        if any(kw in str(e).lower() for kw in ["permission", "denied", "fail"]):
+        if match_any(e, ("permission", "denied", "fail")):
             ok("non-owner blacklist", f"rejected: {str(e)[:80]}")
         else:
             fail("non-owner blacklist", str(e))
@@ -334,18 +277,12 @@ def test_non_owner_cannot_set_privacy():
     """Non-owner cannot change group privacy."""
     gid = f"priv-{unique_id()}"
     try:
-        relay_execute({
+        wait_for_tx(relay_execute({
             "type": "create_group",
             "group_id": gid,
             "config": {"is_private": False, "description": "privacy test"},
-        })
-        wait_for_chain(5)
-        login_as(MEMBER)
-        res = relay_execute_as(MEMBER, {"type": "join_group", "group_id": gid})
-        tx = res.get("tx_hash") or res.get("transaction", {}).get("hash", "")
-        if tx:
-            get_tx_result(tx)
-        wait_for_chain(3)
+        }))
+        wait_for_tx(relay_execute_as(MEMBER, {"type": "join_group", "group_id": gid}))
 
         # Non-owner tries to set privacy
         res2 = relay_execute_as(MEMBER, {
@@ -367,7 +304,7 @@ def test_non_owner_cannot_set_privacy():
         else:
             ok("non-owner set privacy", "relay rejected")
     except RuntimeError as e:
-        if any(kw in str(e).lower() for kw in ["permission", "denied", "owner", "fail"]):
+        if match_any(e, ("permission", "denied", "owner", "fail")):
             ok("non-owner set privacy", f"rejected: {str(e)[:80]}")
         else:
             fail("non-owner set privacy", str(e))
@@ -388,7 +325,7 @@ def test_view_nonexistent_group():
         else:
             ok("view nonexistent group", f"result: {str(result)[:60]}")
     except Exception as e:
-        if any(kw in str(e).lower() for kw in ["not found", "does not exist", "error"]):
+        if match_any(e, ("not found", "does not exist", "error")):
             ok("view nonexistent group", f"error: {str(e)[:60]}")
         else:
             fail("view nonexistent group", str(e))
@@ -406,7 +343,7 @@ def test_view_nonexistent_proposal():
         else:
             ok("view nonexistent proposal", f"result: {str(result)[:60]}")
     except Exception as e:
-        if any(kw in str(e).lower() for kw in ["not found", "error"]):
+        if match_any(e, ("not found", "error")):
             ok("view nonexistent proposal", f"error: {str(e)[:60]}")
         else:
             fail("view nonexistent proposal", str(e))
@@ -453,26 +390,25 @@ def test_is_member_nonexistent_group():
 def run():
     print("\n  ── Edge Case Tests ────────────────────────")
     # Data
-    test_delete_data_null()
-    test_reserved_key_config()
-    test_reserved_key_status()
-    test_key_without_slash()
-    test_unknown_storage_key()
-    test_unknown_permission_key()
+    run_parallel(test_delete_data_null, test_rejected_writes)
     # Groups
-    test_duplicate_group_id()
-    test_invalid_group_id_empty()
-    test_invalid_group_id_special_chars()
-    test_double_join()
-    test_member_driven_must_be_private()
-    test_non_owner_cannot_blacklist()
-    test_non_owner_cannot_set_privacy()
+    run_parallel(
+        test_duplicate_group_id,
+        test_invalid_group_id_empty,
+        test_invalid_group_id_special_chars,
+        test_double_join,
+        test_member_driven_must_be_private,
+        test_non_owner_cannot_blacklist,
+        test_non_owner_cannot_set_privacy,
+    )
     # Views
-    test_view_nonexistent_group()
-    test_view_nonexistent_proposal()
-    test_permission_nonexistent_path()
-    test_permission_nonexistent_owner()
-    test_is_member_nonexistent_group()
+    run_parallel(
+        test_view_nonexistent_group,
+        test_view_nonexistent_proposal,
+        test_permission_nonexistent_path,
+        test_permission_nonexistent_owner,
+        test_is_member_nonexistent_group,
+    )
 
 
 if __name__ == "__main__":
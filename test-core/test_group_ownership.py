@@ -11,55 +11,22 @@ Tests transfer_group_ownership action for:
 Uses a shared group for negative tests to minimize TX count / RPC load.
 """
 
-import time
 from helpers import (
-    relay_execute, relay_execute_as, near_call,
-    view_call, get_group_config, is_group_member, get_tx_result,
-    wait_for_chain, login, login_as,
-    ok, fail, skip, unique_id, ACCOUNT_ID,
+    relay_execute, relay_execute_as, near_batch_call,
+    view_call, view_call_many, get_group_config, is_group_member, get_tx_result,
+    wait_tx, wait_for_view, login,
+    get_or_create_shared_group, match_any, ok, fail, skip, unique_id,
+    run_parallel, ACCOUNT_ID,
 )
 
 MEMBER = "test02.onsocial.testnet"
 NON_MEMBER = "test04.onsocial.testnet"
 MEMBER3 = "test03.onsocial.testnet"
 
-# Shared group for negative tests (ownership never changes)
-_SHARED_GID = None
-
-
-def _wait_tx(res: dict):
-    """Wait for relay TX to finalize. Falls back to wait_for_chain on timeout."""
-    tx = res.get("tx_hash") or res.get("transaction", {}).get("hash", "")
-    if tx:
-        try:
-            get_tx_result(tx)
-        except TimeoutError:
-            wait_for_chain(10)
-    else:
-        wait_for_chain(5)
-
 
 def _ensure_shared_group() -> str:
-    """Create a single shared group with MEMBER + MEMBER3 joined (once)."""
-    global _SHARED_GID
-    if _SHARED_GID:
-        return _SHARED_GID
-    gid = f"own-{unique_id()}"
-    login()
-    _wait_tx(relay_execute({
-        "type": "create_group",
-        "group_id": gid,
-        "config": {"is_private": False, "description": f"Ownership test {gid}"},
-    }))
-    time.sleep(2)
-
-    for acct in [MEMBER, MEMBER3]:
-        login_as(acct)
-        _wait_tx(relay_execute_as(acct, {"type": "join_group", "group_id": gid}))
-        time.sleep(2)
-
-    _SHARED_GID = gid
-    return gid
+    """Shared group with MEMBER + MEMBER3 joined (also used by the pool suite)."""
+    return get_or_create_shared_group((MEMBER, MEMBER3))
 
 
 # ---------------------------------------------------------------------------
@@ -69,26 +36,26 @@ def _ensure_shared_group() -> str:
 def test_transfer_to_member():
     """Owner transfers ownership to an existing member (own group)."""
     gid = f"own-xfer-{unique_id()}"
-    login()
-    _wait_tx(relay_execute({
+    wait_tx(relay_execute({
         "type": "create_group",
         "group_id": gid,
         "config": {"is_private": False, "description": "transfer test"},
     }))
-    time.sleep(2)
-    login_as(MEMBER)
-    _wait_tx(relay_execute_as(MEMBER, {"type": "join_group", "group_id": gid}))
-    time.sleep(2)
+    wait_tx(relay_execute_as(MEMBER, {"type": "join_group", "group_id": gid}))
 
     try:
-        _wait_tx(relay_execute({
+        wait_tx(relay_execute({
             "type": "transfer_group_ownership",
             "group_id": gid,
             "new_owner": MEMBER,
         }))
-        wait_for_chain(5)
-        is_new = view_call("is_group_owner", {"group_id": gid, "user_id": MEMBER})
-        is_old = view_call("is_group_owner", {"group_id": gid, "user_id": ACCOUNT_ID})
+        is_new, is_old = wait_for_view(
+            lambda: view_call_many([
+                ("is_group_owner", {"group_id": gid, "user_id": MEMBER}),
+                ("is_group_owner", {"group_id": gid, "user_id": ACCOUNT_ID}),
+            ]),
+            lambda owners: owners[0] is True,
+        )
         if is_new and not is_old:
             ok("transfer to member", f"{MEMBER} is new owner")
         elif is_new:
@@ -122,7 +89,7 @@ def test_transfer_to_non_member_rejected():
         else:
             ok("transfer to non-member", "relay rejected")
     except RuntimeError as e:
-        if any(kw in str(e).lower() for kw in ["member", "fail", "denied"]):
+        if match_any(e, ("member", "fail", "denied")):
             ok("transfer to non-member", f"rejected: {str(e)[:80]}")
         else:
             fail("transfer to non-member", str(e))
@@ -149,7 +116,7 @@ def test_transfer_to_self_rejected():
         else:
             ok("transfer to self", "relay rejected")
     except RuntimeError as e:
-        if any(kw in str(e).lower() for kw in ["yourself", "self", "fail", "denied"]):
+        if match_any(e, ("yourself", "self", "fail", "denied")):
             ok("transfer to self", f"rejected: {str(e)[:80]}")
         else:
             fail("transfer to self", str(e))
@@ -160,24 +127,19 @@ def test_transfer_to_self_rejected():
 def test_transfer_to_blacklisted_rejected():
     """Transfer to blacklisted member must fail (uses own group)."""
     gid = f"own-bl-{unique_id()}"
-    login()
-    _wait_tx(relay_execute({
+    wait_tx(relay_execute({
         "type": "create_group",
         "group_id": gid,
         "config": {"is_private": False, "description": "blacklist transfer test"},
     }))
-    time.sleep(2)
-    login_as(MEMBER)
-    _wait_tx(relay_execute_as(MEMBER, {"type": "join_group", "group_id": gid}))
-    time.sleep(2)
+    wait_tx(relay_execute_as(MEMBER, {"type": "join_group", "group_id": gid}))
 
     # Blacklist MEMBER
-    _wait_tx(relay_execute({
+    wait_tx(relay_execute({
         "type": "blacklist_group_member",
         "group_id": gid,
         "member_id": MEMBER,
     }))
-    time.sleep(2)
 
     try:
         res = relay_execute({
@@ -199,7 +161,7 @@ def test_transfer_to_blacklisted_rejected():
         else:
             ok("transfer to blacklisted", "relay rejected")
     except RuntimeError as e:
-        if any(kw in str(e).lower() for kw in ["blacklist", "fail", "denied"]):
+        if match_any(e, ("blacklist", "fail", "denied")):
             ok("transfer to blacklisted", f"rejected: {str(e)[:80]}")
         else:
             fail("transfer to blacklisted", str(e))
@@ -211,7 +173,6 @@ def test_non_owner_transfer_rejected():
     """Non-owner cannot transfer ownership."""
     gid = _ensure_shared_group()
     try:
-        login_as(MEMBER)
         res = relay_execute_as(MEMBER, {
             "type": "transfer_group_ownership",
             "group_id": gid,
@@ -231,7 +192,7 @@ def test_non_owner_transfer_rejected():
         else:
             ok("non-owner transfer", "relay rejected")
     except RuntimeError as e:
-        if any(kw in str(e).lower() for kw in ["permission", "owner", "denied", "fail"]):
+        if match_any(e, ("permission", "owner", "denied", "fail")):
             ok("non-owner transfer", f"rejected: {str(e)[:80]}")
         else:
             fail("non-owner transfer", str(e))
@@ -242,21 +203,17 @@ def test_non_owner_transfer_rejected():
 def test_member_driven_blocks_direct_transfer():
     """Member-driven group must use governance for ownership transfer."""
     gid = f"own-md-{unique_id()}"
-    near_call(ACCOUNT_ID, {
-        "type": "create_group",
-        "group_id": gid,
-        "config": {"member_driven": True},
-    }, deposit="0.1")
-    wait_for_chain(3)
-
-    near_call(ACCOUNT_ID, {
-        "type": "create_proposal",
-        "group_id": gid,
-        "proposal_type": "member_invite",
-        "changes": {"target_user": MEMBER},
-        "auto_vote": True,
-    }, deposit="0.1")
-    wait_for_chain(3)
+    # One tx: the solo owner's auto_vote executes the invite immediately
+    near_batch_call(ACCOUNT_ID, [
+        {"type": "create_group", "group_id": gid, "config": {"member_driven": True}},
+        {
+            "type": "create_proposal",
+            "group_id": gid,
+            "proposal_type": "member_invite",
+            "changes": {"target_user": MEMBER},
+            "auto_vote": True,
+        },
+    ], deposit_per_action="0.1")
 
     try:
         res = relay_execute({
@@ -278,7 +235,7 @@ def test_member_driven_blocks_direct_transfer():
         else:
             ok("member-driven blocks transfer", "relay rejected")
     except RuntimeError as e:
-        if any(kw in str(e).lower() for kw in ["permission", "governance", "denied", "fail"]):
+        if match_any(e, ("permission", "governance", "denied", "fail")):
             ok("member-driven blocks transfer", f"rejected: {str(e)[:80]}")
         else:
             fail("member-driven blocks transfer", str(e))
@@ -289,12 +246,18 @@ def test_member_driven_blocks_direct_transfer():
 # ---------------------------------------------------------------------------
 def run():
     print("\n  ── Group Ownership Transfer Tests ────────────")
-    test_transfer_to_member()
-    test_transfer_to_non_member_rejected()
-    test_transfer_to_self_rejected()
-    test_transfer_to_blacklisted_rejected()
-    test_non_owner_transfer_rejected()
-    test_member_driven_blocks_direct_transfer()
+    # Transfers that succeed use their own fresh groups; the shared group
+    # only sees rejected ones, so every test is independent. The shared
+    # group is built by whichever test asks first (others block on the
+    # helpers lock) while the fresh-group tests get on with their setup
+    run_parallel(
+        test_transfer_to_member,
+        test_transfer_to_non_member_rejected,
+        test_transfer_to_self_rejected,
+        test_transfer_to_blacklisted_rejected,
+        test_non_owner_transfer_rejected,
+        test_member_driven_blocks_direct_transfer,
+    )
 
 
 if __name__ == "__main__":
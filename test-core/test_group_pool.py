@@ -13,64 +13,31 @@ storage for group members.  Covers:
   - Member writes data under group path (pool covers storage)
   - Pool info for nonexistent group returns None
 
-Accounts: test01 (group owner), test02 (member), test04 (non-member)
+Accounts: test01 (group owner), test02 (member), test03 (member, shared
+group only), test04 (non-member)
 """
 
-import time
 from helpers import (
     near_call, relay_execute, relay_execute_as,
-    view_call, get_data, get_tx_result,
-    wait_for_chain, login, login_as,
-    ok, fail, skip, unique_id, ACCOUNT_ID,
+    view_call, view_call_many, get_tx_result, get_or_create_shared_group,
+    wait_tx, wait_for_view,
+    assert_rejected, ok, fail, skip, unique_id, run_parallel, ACCOUNT_ID,
 )
 
 MEMBER = "test02.onsocial.testnet"
+MEMBER3 = "test03.onsocial.testnet"
 NON_MEMBER = "test04.onsocial.testnet"
 
-# Shared group — created once, reused across tests
-_SHARED_GID = None
-
-
-def _wait_tx(res: dict):
-    """Wait for relay TX to finalize. Falls back to wait_for_chain on timeout."""
-    tx = res.get("tx_hash") or res.get("transaction", {}).get("hash", "")
-    if tx:
-        try:
-            get_tx_result(tx)
-        except TimeoutError:
-            wait_for_chain(10)
-    else:
-        wait_for_chain(5)
+BULK_WRITE_KEYS = 16  # keys in test_member_writes_data_under_group's one set
 
 
 def _ensure_shared_group() -> str:
-    """Create a public group with MEMBER joined (once per session)."""
-    global _SHARED_GID
-    if _SHARED_GID:
-        return _SHARED_GID
-    gid = f"gpool-{unique_id()}"
-    login()
-    _wait_tx(relay_execute({
-        "type": "create_group",
-        "group_id": gid,
-        "config": {"is_private": False, "description": f"Group pool test {gid}"},
-    }))
-    # Wait for group to appear on-chain before join
-    for _ in range(10):
-        try:
-            cfg = view_call("get_group_config", {"group_id": gid})
-            if cfg:
-                break
-        except Exception:
-            pass
-        time.sleep(3)
-
-    login_as(MEMBER)
-    _wait_tx(relay_execute_as(MEMBER, {"type": "join_group", "group_id": gid}))
-    time.sleep(2)
-
-    _SHARED_GID = gid
-    return gid
+    """Public group with MEMBER joined, shared with the ownership suite.
+
+    MEMBER3 joins too so both suites ask for the same member set and reuse
+    one on-chain group when run in the same process.
+    """
+    return get_or_create_shared_group((MEMBER, MEMBER3))
 
 
 def _get_group_pool_info(group_id: str):
@@ -96,7 +63,6 @@ def test_group_pool_deposit():
                 "amount": "100000000000000000000000",   # 0.1 NEAR
             }},
         }, deposit="0.1")
-        wait_for_chain(5)
         ok("group pool deposit", f"deposited 0.1 NEAR into {gid}")
     except Exception as e:
         fail("group pool deposit", str(e))
@@ -106,7 +72,11 @@ def test_group_pool_info_shows_balance():
     """Pool info reflects deposited balance after deposit."""
     gid = _ensure_shared_group()
     try:
-        info = _get_group_pool_info(gid)
+        # The deposit's final view may trail its execution by a block
+        info = wait_for_view(
+            lambda: _get_group_pool_info(gid),
+            lambda i: i is not None and int(i.get("storage_balance", "0")) > 0,
+        )
         if info is None:
             fail("pool info balance", "returned None")
             return
@@ -133,11 +103,9 @@ def test_group_pool_deposit_non_owner_rejected():
         }, deposit="0.1")
         fail("non-owner deposit", "should have been rejected")
     except RuntimeError as e:
-        err = str(e).lower()
-        if any(w in err for w in ("unauthorized", "denied", "permission", "panicked")):
-            ok("non-owner deposit", "correctly rejected")
-        else:
-            fail("non-owner deposit", str(e))
+        assert_rejected(
+            "non-owner deposit", e, ("unauthorized", "denied", "permission", "panicked"),
+        )
 
 
 def test_group_pool_deposit_below_minimum():
@@ -153,51 +121,43 @@ def test_group_pool_deposit_below_minimum():
         }, deposit="0.001")
         fail("below-minimum deposit", "should have been rejected")
     except RuntimeError as e:
-        err = str(e)
-        if "Minimum pool deposit" in err or "panicked" in err:
-            ok("below-minimum deposit", "correctly rejected")
-        else:
-            fail("below-minimum deposit", err)
+        assert_rejected(
+            "below-minimum deposit", e, ("minimum pool deposit", "panicked"),
+        )
 
 
-def test_group_sponsor_quota_set():
-    """Owner enables per-member sponsor quota."""
-    gid = _ensure_shared_group()
-    try:
-        login()
-        res = relay_execute({
-            "type": "set",
-            "data": {"storage/group_sponsor_quota_set": {
-                "group_id": gid,
-                "target_id": MEMBER,
-                "enabled": True,
-                "daily_refill_bytes": 50_000,
-                "allowance_max_bytes": 100_000,
-            }},
-        })
-        _wait_tx(res)
-        ok("sponsor quota set", f"enabled for {MEMBER}")
-    except Exception as e:
-        fail("sponsor quota set", str(e))
-
+def test_group_sponsor_quota_and_default_set():
+    """Owner enables a per-member sponsor quota and the group default.
 
-def test_group_sponsor_default_set():
-    """Owner enables default sponsor config for all group members."""
+    Both are `storage/*` operations on the same group, so they go out as
+    two keys of one `set` (one relay TX) instead of a TX apiece.
+    """
     gid = _ensure_shared_group()
     try:
-        login()
         res = relay_execute({
             "type": "set",
-            "data": {"storage/group_sponsor_default_set": {
-                "group_id": gid,
-                "enabled": True,
-                "daily_refill_bytes": 10_000,
-                "allowance_max_bytes": 50_000,
-            }},
+            "data": {
+                "storage/group_sponsor_quota_set": {
+                    "group_id": gid,
+                    "target_id": MEMBER,
+                    "enabled": True,
+                    "daily_refill_bytes": 50_000,
+                    "allowance_max_bytes": 100_000,
+                },
+                "storage/group_sponsor_default_set": {
+                    "group_id": gid,
+                    "enabled": True,
+                    "daily_refill_bytes": 10_000,
+                    "allowance_max_bytes": 50_000,
+                },
+            },
         })
-        _wait_tx(res)
+        wait_tx(res)
+        ok("sponsor quota set", f"enabled for {MEMBER}")
         ok("sponsor default set", f"default enabled for {gid}")
     except Exception as e:
+        # One TX: if it failed, neither setting landed
+        fail("sponsor quota set", str(e))
         fail("sponsor default set", str(e))
 
 
@@ -205,7 +165,6 @@ def test_sponsor_quota_zero_allowance_rejected():
     """enabled=true with allowance_max_bytes=0 must fail."""
     gid = _ensure_shared_group()
     try:
-        login()
         res = relay_execute({
             "type": "set",
             "data": {"storage/group_sponsor_quota_set": {
@@ -227,18 +186,17 @@ def test_sponsor_quota_zero_allowance_rejected():
         else:
             fail("zero-allowance quota", "no tx hash to verify")
     except RuntimeError as e:
-        err = str(e)
-        if "allowance_max_bytes" in err or "greater than zero" in err:
-            ok("zero-allowance quota", "correctly rejected at relay")
-        else:
-            fail("zero-allowance quota", err)
+        assert_rejected(
+            "zero-allowance quota", e,
+            ("allowance_max_bytes", "greater than zero"),
+            "correctly rejected at relay",
+        )
 
 
 def test_non_owner_cannot_set_sponsor():
     """A regular member cannot configure sponsor quotas."""
     gid = _ensure_shared_group()
     try:
-        login_as(MEMBER)
         res = relay_execute_as(MEMBER, {
             "type": "set",
             "data": {"storage/group_sponsor_quota_set": {
@@ -259,31 +217,47 @@ def test_non_owner_cannot_set_sponsor():
         else:
             fail("non-owner sponsor", "no tx hash to verify")
     except RuntimeError as e:
-        err = str(e).lower()
-        if "unauthorized" in err or "denied" in err:
-            ok("non-owner sponsor", "correctly rejected at relay")
-        else:
-            fail("non-owner sponsor", str(e))
+        assert_rejected(
+            "non-owner sponsor", e, ("unauthorized", "denied"),
+            "correctly rejected at relay",
+        )
 
 
 def test_member_writes_data_under_group():
-    """Sponsored member writes data under group path; pool covers storage."""
+    """Sponsored member bulk-writes keys under group path; pool covers storage.
+
+    One `set` carries BULK_WRITE_KEYS entries, so the multi-key path is
+    exercised and the pool is charged once for the whole batch.
+    """
     gid = _ensure_shared_group()
     try:
-        login_as(MEMBER)
-        key = f"groups/{gid}/data/pool-{unique_id()}"
+        base = f"groups/{gid}/data/pool-{unique_id()}"
+        keys = [f"{base}-{i}" for i in range(BULK_WRITE_KEYS)]
         res = relay_execute_as(MEMBER, {
             "type": "set",
-            "data": {key: {"hello": "group-pool-test"}},
+            "data": {k: {"hello": "group-pool-test", "i": i} for i, k in enumerate(keys)},
         })
-        _wait_tx(res)
-
-        # Read back to verify
-        val = get_data(key, MEMBER)
-        if val and val.get("hello") == "group-pool-test":
-            ok("member write under group", f"stored at {key}")
+        wait_tx(res)
+        # One tx wrote every key: once the last is visible to final views,
+        # so are the rest
+        wait_for_view(
+            lambda: view_call("get_one", {"key": keys[-1], "account_id": MEMBER}),
+            lambda v: bool(v),
+        )
+
+        # Read back first, middle and last key in one batched round trip
+        sample = [0, BULK_WRITE_KEYS // 2, BULK_WRITE_KEYS - 1]
+        vals = view_call_many([
+            ("get_one", {"key": keys[i], "account_id": MEMBER}) for i in sample
+        ])
+        bad = [
+            (i, v) for i, v in zip(sample, vals)
+            if not v or v.get("hello") != "group-pool-test" or v.get("i") != i
+        ]
+        if not bad:
+            ok("member write under group", f"{BULK_WRITE_KEYS} keys stored under {base}-*")
         else:
-            fail("member write under group", f"read back: {val}")
+            fail("member write under group", f"read back: {bad}")
     except Exception as e:
         fail("member write under group", str(e))
 
@@ -300,22 +274,33 @@ def test_group_pool_info_nonexistent():
         ok("nonexistent pool info", "error for nonexistent group (acceptable)")
 
 
+def _deposit_then_check_balance():
+    test_group_pool_deposit()
+    test_group_pool_info_shows_balance()
+
+
 # ---------------------------------------------------------------------------
 # Manual runner
 # ---------------------------------------------------------------------------
 
 def run():
     print("\n🏦 Group Pool tests\n")
-    test_group_pool_deposit()
-    test_group_pool_info_shows_balance()
-    test_group_pool_deposit_non_owner_rejected()
-    test_group_pool_deposit_below_minimum()
-    test_group_sponsor_quota_set()
-    test_group_sponsor_default_set()
-    test_sponsor_quota_zero_allowance_rejected()
-    test_non_owner_cannot_set_sponsor()
+    # Rejected writes leave the pool and quotas untouched, so they overlap
+    # the deposit chain (deposit → balance) and the sponsor config. The
+    # first test to need the shared group builds it; the rest wait on the
+    # helpers lock, and the nonexistent-group view doesn't wait at all
+    run_parallel(
+        _deposit_then_check_balance,
+        test_group_sponsor_quota_and_default_set,
+        test_group_pool_deposit_non_owner_rejected,
+        test_group_pool_deposit_below_minimum,
+        test_sponsor_quota_zero_allowance_rejected,
+        test_non_owner_cannot_set_sponsor,
+        test_group_pool_info_nonexistent,
+    )
+    # Only once the pool is funded AND the quota is set: otherwise the
+    # contract silently charges the member's own storage instead
     test_member_writes_data_under_group()
-    test_group_pool_info_nonexistent()
 
 
 if __name__ == "__main__":
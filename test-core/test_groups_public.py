@@ -9,11 +9,12 @@ data write, which triggers the 6KB onboarding allowance.
 """
 
 from helpers import (
-    relay_execute, relay_execute_as, view_call, near_call,
+    relay_execute, relay_execute_as, relay_execute_bytes, encode_relay_body,
+    view_call, near_call,
     get_group_config, is_group_member, get_group_stats,
     has_permission, get_permissions, get_tx_result,
-    wait_for_chain, login, login_as,
-    ok, fail, skip, unique_id, ACCOUNT_ID,
+    wait_for_chain, login, login_as, login_many,
+    match_any, ok, fail, skip, unique_id, ACCOUNT_ID,
 )
 
 JOINER = "test02.onsocial.testnet"
@@ -34,12 +35,15 @@ def _gid():
 
 def ensure_platform_sponsored():
     """Ensure all test accounts are platform-sponsored via a small data write."""
+    try:
+        login_many(ALL_ACCOUNTS)
+    except Exception:
+        pass  # any account that failed is retried in the loop below
+    body = encode_relay_body({"type": "set", "data": {"profile/setup": "1"}})
     for acct in ALL_ACCOUNTS:
         try:
             login_as(acct)
-            relay_execute_as(acct, {"type": "set", "data": {
-                "profile/setup": "1",
-            }})
+            relay_execute_bytes(acct, body)
         except Exception:
             pass  # already sponsored or will retry
     wait_for_chain(3)
@@ -172,7 +176,7 @@ def test_member_can_write_content():
         else:
             ok("member write content", f"result: {str(result)[:80]}")
     except Exception as e:
-        if "permission" in str(e).lower():
+        if match_any(e, ("permission",)):
             fail("member write content", f"permission denied: {str(e)[:80]}")
         else:
             fail("member write content", str(e))
@@ -194,7 +198,7 @@ def test_outsider_cannot_write():
         else:
             skip("outsider write", "outsider is somehow a member")
     except Exception as e:
-        if "permission" in str(e).lower() or "denied" in str(e).lower() or "not a member" in str(e).lower():
+        if match_any(e, ("permission", "denied", "not a member")):
             ok("outsider write", f"correctly rejected: {str(e)[:60]}")
         else:
             fail("outsider write", str(e))
@@ -246,7 +250,7 @@ def test_owner_cannot_leave():
         else:
             ok("owner cannot leave", "no tx_hash — relay may have rejected")
     except Exception as e:
-        if "owner" in str(e).lower() or "cannot" in str(e).lower() or "transfer" in str(e).lower():
+        if match_any(e, ("owner", "cannot", "transfer")):
             ok("owner cannot leave", f"correctly rejected: {str(e)[:60]}")
         else:
             ok("owner cannot leave", f"contract rejected: {str(e)[:80]}")
@@ -299,7 +303,7 @@ def test_admin_can_add_member():
         else:
             fail("admin add member", f"{OUTSIDER} not a member after add")
     except Exception as e:
-        if "permission" in str(e).lower():
+        if match_any(e, ("permission",)):
             skip("admin add member", f"may need different permission: {str(e)[:60]}")
         else:
             fail("admin add member", str(e))
@@ -325,7 +329,7 @@ def test_admin_can_remove_member():
         else:
             fail("admin remove member", f"{OUTSIDER} still a member")
     except Exception as e:
-        if "permission" in str(e).lower():
+        if match_any(e, ("permission",)):
             skip("admin remove member", f"may need different permission: {str(e)[:60]}")
         else:
             fail("admin remove member", str(e))
@@ -430,7 +434,7 @@ def test_blacklisted_cannot_rejoin():
         else:
             fail("blacklisted cannot rejoin", "blacklisted user rejoined")
     except Exception as e:
-        if "blacklist" in str(e).lower() or "banned" in str(e).lower():
+        if match_any(e, ("blacklist", "banned")):
             ok("blacklisted cannot rejoin", f"correctly rejected: {str(e)[:60]}")
         else:
             ok("blacklisted cannot rejoin", f"contract rejected: {str(e)[:80]}")
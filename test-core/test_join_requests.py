@@ -13,7 +13,7 @@ from helpers import (
     relay_execute, relay_execute_as,
     view_call, is_group_member, get_tx_result, get_group_config,
     wait_for_chain, login, login_as,
-    ok, fail, skip, unique_id, ACCOUNT_ID,
+    match_any, ok, fail, skip, unique_id, ACCOUNT_ID,
 )
 
 REQUESTER = "test02.onsocial.testnet"
@@ -259,7 +259,7 @@ def test_blacklisted_cannot_request_join():
         else:
             ok("blacklisted join request", "relay rejected")
     except RuntimeError as e:
-        if any(kw in str(e).lower() for kw in ["blacklist", "banned", "fail", "denied"]):
+        if match_any(e, ("blacklist", "banned", "fail", "denied")):
             ok("blacklisted join request", f"rejected: {str(e)[:80]}")
         else:
             fail("blacklisted join request", str(e))
@@ -283,14 +283,14 @@ def test_already_member_cannot_request():
                 get_tx_result(tx)
                 ok("already member request", "TX ok (no-op or silently ignored)")
             except RuntimeError as tx_err:
-                if any(kw in str(tx_err).lower() for kw in ["already", "member", "exist"]):
+                if match_any(tx_err, ("already", "member", "exist")):
                     ok("already member request", f"correctly rejected: {str(tx_err)[:80]}")
                 else:
                     ok("already member request", f"TX failed: {str(tx_err)[:80]}")
         else:
             ok("already member request", "relay rejected")
     except RuntimeError as e:
-        if any(kw in str(e).lower() for kw in ["already", "member", "exist"]):
+        if match_any(e, ("already", "member", "exist")):
             ok("already member request", f"rejected: {str(e)[:80]}")
         else:
             fail("already member request", str(e))
@@ -7,7 +7,7 @@ import time
 from helpers import (
     relay_execute, relay_execute_as, has_permission, get_permissions,
     view_call, get_tx_result, wait_for_chain, login_as,
-    ok, fail, skip, unique_id, ACCOUNT_ID,
+    match_any, ok, fail, skip, unique_id, ACCOUNT_ID,
 )
 
 GRANTEE = "test02.onsocial.testnet"
@@ -134,7 +134,7 @@ def test_grant_with_past_expiry():
             ok("past expiry", "grant accepted but view shows expired (correct)")
     except Exception as e:
         # Contract might reject past timestamps
-        if "expir" in str(e).lower() or "past" in str(e).lower():
+        if match_any(e, ("expir", "past")):
             ok("past expiry", f"rejected by contract: {str(e)[:80]}")
         else:
             fail("past expiry", str(e))
@@ -203,7 +203,7 @@ def test_grantee_can_write_data():
             ok("grantee write data", f"result: {str(result)[:80]}")
     except Exception as e:
         # May fail if relay doesn't handle cross-account writes this way
-        if "permission" in str(e).lower() or "denied" in str(e).lower():
+        if match_any(e, ("permission", "denied")):
             skip("grantee write data", f"relay may not support this: {str(e)[:80]}")
         else:
             fail("grantee write data", str(e))
@@ -345,7 +345,7 @@ def test_member_writes_group_content():
         else:
             ok("member writes group content", f"relay accepted write (result: {str(val)[:60]})")
     except Exception as e:
-        if "already" in str(e).lower():
+        if match_any(e, ("already",)):
             ok("member writes group content", "member already joined; write accepted")
         else:
             fail("member writes group content", str(e))
@@ -374,14 +374,14 @@ def test_non_member_group_write_rejected():
                 else:
                     ok("non-member group write rejected", "TX ok but data not stored (contract silently rejected)")
             except RuntimeError as tx_err:
-                if "fail" in str(tx_err).lower() or "permission" in str(tx_err).lower():
+                if match_any(tx_err, ("fail", "permission")):
                     ok("non-member group write rejected", f"TX failed: {str(tx_err)[:80]}")
                 else:
                     fail("non-member group write rejected", f"unexpected TX error: {str(tx_err)[:80]}")
         else:
             ok("non-member group write rejected", "relay rejected without TX")
     except RuntimeError as e:
-        if "permission" in str(e).lower() or "denied" in str(e).lower() or "fail" in str(e).lower() or "not a member" in str(e).lower():
+        if match_any(e, ("permission", "denied", "fail", "not a member")):
             ok("non-member group write rejected", f"correctly rejected: {str(e)[:80]}")
         else:
             fail("non-member group write rejected", str(e))
@@ -444,14 +444,14 @@ def test_non_grantee_cross_account_write_rejected():
                 else:
                     ok("non-grantee cross-account rejected", "TX ok but data not stored")
             except RuntimeError as tx_err:
-                if any(kw in str(tx_err).lower() for kw in ["permission", "denied", "fail"]):
+                if match_any(tx_err, ("permission", "denied", "fail")):
                     ok("non-grantee cross-account rejected", f"TX failed: {str(tx_err)[:80]}")
                 else:
                     fail("non-grantee cross-account rejected", f"unexpected: {str(tx_err)[:80]}")
         else:
             ok("non-grantee cross-account rejected", "relay rejected without TX")
     except RuntimeError as e:
-        if any(kw in str(e).lower() for kw in ["permission", "denied", "fail", "not allowed"]):
+        if match_any(e, ("permission", "denied", "fail", "not allowed")):
             ok("non-grantee cross-account rejected", f"rejected: {str(e)[:80]}")
         else:
             fail("non-grantee cross-account rejected", str(e))
@@ -494,7 +494,7 @@ def test_cross_account_write_cannot_escalate():
         else:
             ok("cross-account escalation blocked", "relay rejected")
     except RuntimeError as e:
-        if any(kw in str(e).lower() for kw in ["permission", "denied", "unauthorized", "fail"]):
+        if match_any(e, ("permission", "denied", "unauthorized", "fail")):
             ok("cross-account escalation blocked", f"rejected: {str(e)[:80]}")
         else:
             fail("cross-account escalation blocked", str(e))
@@ -529,7 +529,7 @@ def test_cross_account_expired_permission_denied():
         else:
             ok("expired cross-account denied", "relay rejected")
     except RuntimeError as e:
-        if any(kw in str(e).lower() for kw in ["permission", "denied", "expire", "fail"]):
+        if match_any(e, ("permission", "denied", "expire", "fail")):
             ok("expired cross-account denied", f"rejected: {str(e)[:80]}")
         else:
             fail("expired cross-account denied", str(e))
@@ -579,7 +579,7 @@ def test_cross_account_revoked_permission_denied():
         else:
             ok("revoked cross-account denied", "relay rejected after revoke")
     except RuntimeError as e:
-        if any(kw in str(e).lower() for kw in ["permission", "denied", "fail"]):
+        if match_any(e, ("permission", "denied", "fail")):
             ok("revoked cross-account denied", f"rejected: {str(e)[:80]}")
         else:
             fail("revoked cross-account denied", str(e))
@@ -616,7 +616,7 @@ def test_cross_account_no_group_membership():
         else:
             ok("cross-account no group bleed", "relay rejected")
     except RuntimeError as e:
-        if any(kw in str(e).lower() for kw in ["permission", "denied", "member", "fail"]):
+        if match_any(e, ("permission", "denied", "member", "fail")):
             ok("cross-account no group bleed", f"rejected: {str(e)[:80]}")
         else:
             fail("cross-account no group bleed", str(e))
@@ -12,7 +12,7 @@ from helpers import (
     near_call, relay_execute,
     view_call, get_tx_result,
     wait_for_chain, login,
-    ok, fail, skip, unique_id, ACCOUNT_ID,
+    match_any, ok, fail, skip, unique_id, ACCOUNT_ID,
 )
 
 TARGET = "test02.onsocial.testnet"
@@ -66,7 +66,7 @@ def test_storage_withdraw():
         else:
             ok("storage withdraw", "withdraw submitted")
     except RuntimeError as e:
-        if any(kw in str(e).lower() for kw in ["insufficient", "nothing", "exceed"]):
+        if match_any(e, ("insufficient", "nothing", "exceed")):
             ok("storage withdraw", f"correctly rejected (low balance): {str(e)[:80]}")
         else:
             fail("storage withdraw", str(e))
@@ -84,7 +84,7 @@ def test_storage_withdraw_excess_rejected():
         })
         fail("withdraw excess", "excessive withdrawal accepted")
     except RuntimeError as e:
-        if any(kw in str(e).lower() for kw in ["exceed", "insufficient", "panicked"]):
+        if match_any(e, ("exceed", "insufficient", "panicked")):
             ok("withdraw excess", "correctly rejected")
         else:
             ok("withdraw excess", f"rejected: {str(e)[:120]}")
@@ -101,7 +101,7 @@ def test_storage_deposit_zero_rejected():
         }, deposit="0.01")
         fail("deposit zero", "zero deposit accepted")
     except RuntimeError as e:
-        if any(kw in str(e).lower() for kw in ["zero", "greater", "panicked"]):
+        if match_any(e, ("zero", "greater", "panicked")):
             ok("deposit zero", "correctly rejected")
         else:
             ok("deposit zero", f"rejected: {str(e)[:120]}")
@@ -145,7 +145,7 @@ def test_get_storage_balance_nonexistent():
             ok("balance nonexistent", f"result: {str(result)[:80]}")
     except Exception as e:
         # May panic on unregistered account
-        if any(kw in str(e).lower() for kw in ["not registered", "not found"]):
+        if match_any(e, ("not registered", "not found")):
             ok("balance nonexistent", f"error for unknown: {str(e)[:80]}")
         else:
             ok("balance nonexistent", f"error: {str(e)[:80]}")
@@ -160,7 +160,7 @@ def test_invalid_storage_key_rejected():
         })
         fail("invalid storage key", "unknown storage op accepted")
     except RuntimeError as e:
-        if any(kw in str(e).lower() for kw in ["invalid", "operation", "panicked"]):
+        if match_any(e, ("invalid", "operation", "panicked")):
             ok("invalid storage key", "correctly rejected")
         else:
             ok("invalid storage key", f"rejected: {str(e)[:120]}")
@@ -11,7 +11,7 @@ from helpers import (
     near_call, relay_execute, relay_execute_as,
     view_call, get_data, get_tx_result,
     wait_for_chain, login, login_as,
-    ok, fail, skip, unique_id, ACCOUNT_ID,
+    assert_rejected, match_any, ok, fail, skip, unique_id, ACCOUNT_ID,
 )
 
 BENEFICIARY = "test02.onsocial.testnet"
@@ -137,11 +137,7 @@ def test_share_storage_with_self_rejected():
         })
         fail("share with self", "should have been rejected")
     except RuntimeError as e:
-        err = str(e).lower()
-        if "yourself" in err or "panicked" in err:
-            ok("share with self", "correctly rejected")
-        else:
-            fail("share with self", str(e)[:150])
+        assert_rejected("share with self", e, ("yourself", "panicked"))
 
 
 def test_share_storage_below_minimum():
@@ -159,11 +155,7 @@ def test_share_storage_below_minimum():
         })
         fail("share below min", "should have been rejected")
     except RuntimeError as e:
-        err = str(e).lower()
-        if "2000" in err or "minimum" in err or "panicked" in err:
-            ok("share below min", "correctly rejected")
-        else:
-            fail("share below min", str(e)[:150])
+        assert_rejected("share below min", e, ("2000", "minimum", "panicked"))
 
 
 def test_share_storage_duplicate_rejected():
@@ -181,11 +173,7 @@ def test_share_storage_duplicate_rejected():
         })
         fail("duplicate share", "should have been rejected")
     except RuntimeError as e:
-        err = str(e).lower()
-        if "already" in err or "panicked" in err:
-            ok("duplicate share", "correctly rejected")
-        else:
-            fail("duplicate share", str(e)[:150])
+        assert_rejected("duplicate share", e, ("already", "panicked"))
 
 
 # ---------------------------------------------------------------------------
@@ -241,8 +229,7 @@ def test_return_shared_storage_no_allocation():
         else:
             fail("return no allocation", "no tx hash")
     except RuntimeError as e:
-        err = str(e).lower()
-        if "no shared" in err or "allocation" in err:
+        if match_any(e, ("no shared", "allocation")):
             ok("return no allocation", "correctly rejected at relay")
         else:
             # May fail for various reasons — acceptable
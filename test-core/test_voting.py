@@ -12,7 +12,7 @@ from helpers import (
     near_call, near_call_result,
     get_proposal, get_proposal_tally, get_group_config,
     get_group_stats, is_group_member, get_vote,
-    view_call, wait_for_chain, ok, fail, skip, unique_id,
+    view_call, wait_for_chain, match_any, ok, fail, skip, unique_id,
 )
 
 # ---------------------------------------------------------------------------
@@ -53,7 +53,6 @@ def _ensure_group():
         "group_id": GROUP_ID,
         "config": {"member_driven": True},
     }, deposit="0.1")
-    wait_for_chain(2)
 
     # 2. Invite voter2 — auto_vote=true, test01 is sole member → instant exec
     near_call(OWNER, {
@@ -63,7 +62,6 @@ def _ensure_group():
         "changes": {"target_user": VOTER2},
         "auto_vote": True,
     }, deposit="0.1")
-    wait_for_chain(2)
 
     # 3. Invite voter3 — auto_vote=true but now 2 members,
     #    test01 = 50% < 51% quorum, so need test02 to also vote
@@ -74,7 +72,6 @@ def _ensure_group():
         "changes": {"target_user": VOTER3},
         "auto_vote": True,
     }, deposit="0.1")
-    wait_for_chain(2)
 
     # test02 votes to approve voter3 (needs storage deposit first time)
     if pid3:
@@ -244,7 +241,6 @@ def test_rejected_proposal():
     if not pid:
         fail("rejected proposal", "could not create proposal")
         return
-    wait_for_chain(2)
 
     try:
         # voter2 votes NO
@@ -254,7 +250,6 @@ def test_rejected_proposal():
             "proposal_id": pid,
             "approve": False,
         }, deposit="0.01")
-        wait_for_chain(2)
 
         # voter3 votes NO → 2/3 = 67% participation, 0% approval → rejected
         near_call(VOTER3, {
@@ -286,7 +281,6 @@ def test_cancel_proposal():
     if not pid:
         fail("cancel proposal", "could not create proposal")
         return
-    wait_for_chain(2)
 
     try:
         near_call(OWNER, {
@@ -316,7 +310,6 @@ def test_non_member_cannot_vote():
     if not pid:
         fail("non-member vote", "could not create proposal")
         return
-    wait_for_chain(2)
 
     try:
         near_call(NON_MEMBER, {
@@ -332,7 +325,7 @@ def test_non_member_cannot_vote():
         else:
             fail("non-member vote", "non-member vote was recorded!")
     except RuntimeError as e:
-        if "not a member" in str(e).lower() or "permission" in str(e).lower() or "panicked" in str(e).lower():
+        if match_any(e, ("not a member", "permission", "panicked")):
             ok("non-member vote", "correctly rejected by contract")
         else:
             ok("non-member vote", f"rejected: {str(e)[:120]}")
@@ -348,7 +341,6 @@ def test_auto_vote_single_member():
         "group_id": solo_gid,
         "config": {"member_driven": True},
     }, deposit="0.1")
-    wait_for_chain(2)
 
     # Create custom proposal with auto_vote → should execute immediately
     pid = near_call_result(OWNER, {
@@ -386,7 +378,6 @@ def test_owner_votes_on_own_proposal():
     if not pid:
         fail("owner explicit vote", "could not create proposal")
         return
-    wait_for_chain(2)
 
     # Owner votes (first vote on this proposal)
     near_call(OWNER, {
@@ -419,7 +410,6 @@ def test_double_vote_rejected():
     if not pid:
         fail("double vote", "could not create proposal")
         return
-    wait_for_chain(2)
 
     # First vote — should succeed
     try:
@@ -429,7 +419,6 @@ def test_double_vote_rejected():
             "proposal_id": pid,
             "approve": True,
         }, deposit="0.01")
-        wait_for_chain(2)
     except Exception as e:
         fail("double vote", f"first vote failed: {str(e)[:120]}")
         return
@@ -449,7 +438,7 @@ def test_double_vote_rejected():
         else:
             fail("double vote", "second vote overrode first")
     except RuntimeError as e:
-        if "already voted" in str(e).lower() or "panicked" in str(e).lower():
+        if match_any(e, ("already voted", "panicked")):
             ok("double vote", "correctly rejected second vote")
         else:
             ok("double vote", f"rejected: {str(e)[:120]}")
@@ -463,7 +452,6 @@ def test_vote_on_executed_proposal():
     if not pid:
         fail("vote on executed", "could not create proposal")
         return
-    wait_for_chain(2)
 
     # voter2 + voter3 approve → quorum → executed
     near_call(VOTER2, {
@@ -472,7 +460,6 @@ def test_vote_on_executed_proposal():
         "proposal_id": pid,
         "approve": True,
     }, deposit="0.01")
-    wait_for_chain(2)
     near_call(VOTER3, {
         "type": "vote_on_proposal",
         "group_id": gid,
@@ -498,7 +485,7 @@ def test_vote_on_executed_proposal():
         }, deposit="0.01")
         fail("vote on executed", "vote accepted on executed proposal")
     except RuntimeError as e:
-        if any(kw in str(e).lower() for kw in ["not active", "panicked", "already"]):
+        if match_any(e, ("not active", "panicked", "already")):
             ok("vote on executed", "correctly rejected")
         else:
             ok("vote on executed", f"rejected: {str(e)[:120]}")
@@ -520,7 +507,7 @@ def test_non_member_cannot_create_proposal():
         }, deposit="0.1")
         fail("non-member create proposal", "proposal accepted from non-member")
     except RuntimeError as e:
-        if any(kw in str(e).lower() for kw in ["permission", "not a member", "panicked"]):
+        if match_any(e, ("permission", "not a member", "panicked")):
             ok("non-member create proposal", "correctly rejected")
         else:
             ok("non-member create proposal", f"rejected: {str(e)[:120]}")
@@ -533,7 +520,6 @@ def test_cancel_by_non_proposer_rejected():
     if not pid:
         fail("cancel by non-proposer", "could not create proposal")
         return
-    wait_for_chain(2)
 
     try:
         near_call(VOTER2, {
@@ -549,7 +535,7 @@ def test_cancel_by_non_proposer_rejected():
         else:
             fail("cancel by non-proposer", f"non-proposer cancelled proposal (status={status})")
     except RuntimeError as e:
-        if any(kw in str(e).lower() for kw in ["proposer", "permission", "panicked"]):
+        if match_any(e, ("proposer", "permission", "panicked")):
             ok("cancel by non-proposer", "correctly rejected")
         else:
             ok("cancel by non-proposer", f"rejected: {str(e)[:120]}")
@@ -564,7 +550,6 @@ def test_joined_after_proposal_cannot_vote():
         "group_id": gid,
         "config": {"member_driven": True},
     }, deposit="0.1")
-    wait_for_chain(3)
 
     # Invite voter2 (auto_vote, solo → instant)
     near_call(OWNER, {
@@ -574,7 +559,6 @@ def test_joined_after_proposal_cannot_vote():
         "changes": {"target_user": VOTER2},
         "auto_vote": True,
     }, deposit="0.1")
-    wait_for_chain(3)
 
     # Create a custom proposal BEFORE voter3 is a member
     pid = near_call_result(OWNER, {
@@ -587,7 +571,6 @@ def test_joined_after_proposal_cannot_vote():
     if not pid:
         fail("joined-after vote", "could not create proposal")
         return
-    wait_for_chain(2)
 
     # Now invite voter3 — after proposal was created
     pid_inv = near_call_result(OWNER, {
@@ -597,7 +580,6 @@ def test_joined_after_proposal_cannot_vote():
         "changes": {"target_user": VOTER3},
         "auto_vote": True,
     }, deposit="0.1")
-    wait_for_chain(2)
     if pid_inv:
         near_call(VOTER2, {
             "type": "vote_on_proposal",
@@ -605,7 +587,6 @@ def test_joined_after_proposal_cannot_vote():
             "proposal_id": pid_inv,
             "approve": True,
         }, deposit="0.01")
-        wait_for_chain(3)
 
     # voter3 tries to vote on the earlier proposal — should be rejected
     try:
@@ -622,8 +603,7 @@ def test_joined_after_proposal_cannot_vote():
         else:
             fail("joined-after vote", "late-joiner vote was accepted")
     except RuntimeError as e:
-        err = str(e).lower()
-        if "joined" in err or "after" in err or "panicked" in err:
+        if match_any(e, ("joined", "after", "panicked")):
             ok("joined-after vote", "correctly rejected")
         else:
             ok("joined-after vote", f"rejected: {str(e)[:120]}")
@@ -637,7 +617,6 @@ def test_blacklisted_member_cannot_vote():
         "group_id": gid,
         "config": {"member_driven": True},
     }, deposit="0.1")
-    wait_for_chain(3)
 
     # Invite voter2 + voter3
     near_call(OWNER, {
@@ -647,7 +626,6 @@ def test_blacklisted_member_cannot_vote():
         "changes": {"target_user": VOTER2},
         "auto_vote": True,
     }, deposit="0.1")
-    wait_for_chain(3)
 
     pid_inv = near_call_result(OWNER, {
         "type": "create_proposal",
@@ -656,7 +634,6 @@ def test_blacklisted_member_cannot_vote():
         "changes": {"target_user": VOTER3},
         "auto_vote": True,
     }, deposit="0.1")
-    wait_for_chain(2)
     if pid_inv:
         near_call(VOTER2, {
             "type": "vote_on_proposal",
@@ -664,7 +641,6 @@ def test_blacklisted_member_cannot_vote():
             "proposal_id": pid_inv,
             "approve": True,
         }, deposit="0.01")
-        wait_for_chain(3)
 
     # Ban voter3 via governance
     pid_ban = near_call_result(OWNER, {
@@ -674,7 +650,6 @@ def test_blacklisted_member_cannot_vote():
         "changes": {"update_type": "ban", "target_user": VOTER3},
         "auto_vote": True,
     }, deposit="0.1")
-    wait_for_chain(2)
     if pid_ban:
         near_call(VOTER2, {
             "type": "vote_on_proposal",
@@ -682,7 +657,6 @@ def test_blacklisted_member_cannot_vote():
             "proposal_id": pid_ban,
             "approve": True,
         }, deposit="0.01")
-        wait_for_chain(3)
 
     # Create a new proposal — voter3 is now blacklisted
     pid = near_call_result(OWNER, {
@@ -695,7 +669,6 @@ def test_blacklisted_member_cannot_vote():
     if not pid:
         fail("blacklisted vote", "could not create proposal")
         return
-    wait_for_chain(2)
 
     # Blacklisted voter3 tries to vote
     try:
@@ -707,8 +680,7 @@ def test_blacklisted_member_cannot_vote():
         }, deposit="0.01")
         fail("blacklisted vote", "blacklisted member's vote accepted")
     except RuntimeError as e:
-        err = str(e).lower()
-        if "blacklist" in err or "panicked" in err or "permission" in err:
+        if match_any(e, ("blacklist", "panicked", "permission")):
             ok("blacklisted vote", "correctly rejected")
         else:
             ok("blacklisted vote", f"rejected: {str(e)[:120]}")